@@ -10,65 +10,135 @@ Prints the JWT to stdout on success, exits non-zero on failure.
 """
 
 import base64
+import functools
 import hashlib
-import hmac
+import http.client
 import json
 import os
-import struct
 import sys
 import time
-import urllib.error
-import urllib.request
+from typing import Any
 
+try:
+    import orjson
 
-def generate_totp(secret: str, period: int = 30, digits: int = 6) -> str:
-    """Generate a TOTP code from a base32-encoded secret (RFC 6238)."""
-    key = base64.b32decode(secret.upper() + "=" * (-len(secret) % 8))
-    counter = struct.pack(">Q", int(time.time()) // period)
-    mac = hmac.new(key, counter, hashlib.sha1).digest()
-    offset = mac[-1] & 0x0F
-    code = struct.unpack(">I", mac[offset : offset + 4])[0] & 0x7FFFFFFF
-    return str(code % (10**digits)).zfill(digits)
+    _HAVE_ORJSON = True
+except ImportError:  # optional; the setup script runs dh_login.py on a bare system python3
+    _HAVE_ORJSON = False
 
+_DOCKERHUB_HOST = "hub.docker.com"
 
-def post_json(url: str, payload: dict[str, str]) -> dict[str, str]:
-    """POST JSON and return parsed response."""
-    data = json.dumps(payload).encode()
-    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"}, method="POST")
-    try:
-        with urllib.request.urlopen(req) as resp:
-            result: dict[str, str] = json.loads(resp.read())
-            return result
-    except urllib.error.HTTPError as e:
-        body = e.read().decode(errors="replace")
-        print(f"ERROR: HTTP {e.code} from {url}: {body}", file=sys.stderr)
-        sys.exit(1)
+# Transient Docker Hub failures are retried on the same keep-alive connection
+_RETRY_STATUS = frozenset((429, 502, 503, 504))
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF_SEC = 0.3
 
+# HMAC-SHA1 block size and ipad/opad XOR tables (as in the stdlib hmac module)
+_SHA1_BLOCK = 64
+_TRANS_36 = bytes(x ^ 0x36 for x in range(256))
+_TRANS_5C = bytes(x ^ 0x5C for x in range(256))
 
-def main() -> None:
-    user = os.environ.get("DOCKERHUB_ADMIN_USER", "")
-    password = os.environ.get("DOCKERHUB_ADMIN_PASSWORD", "")
-    totp_secret = os.environ.get("DOCKERHUB_TOTP_SECRET", "")
+# 10**n for every digit count a 31-bit dynamic-truncation value can fill
+_POW10 = tuple(10**n for n in range(11))
 
-    if not user or not password:
-        print("ERROR: DOCKERHUB_ADMIN_USER and DOCKERHUB_ADMIN_PASSWORD must be set", file=sys.stderr)
+
+@functools.lru_cache(maxsize=4)
+def _decode_secret(secret: str) -> bytes:
+    """Decode a base32 TOTP secret (case-insensitive, padding optional)."""
+    return base64.b32decode(secret.upper() + "=" * (-len(secret) % 8))
+
+
+@functools.lru_cache(maxsize=4)
+def _hmac_sha1_pads(secret: str) -> "tuple[hashlib._Hash, hashlib._Hash]":
+    """Return SHA-1 states pre-fed with the HMAC inner/outer padded key (RFC 2104).
+
+    Callers must ``copy()`` both before use.
+    """
+    key = _decode_secret(secret)
+    if len(key) > _SHA1_BLOCK:
+        key = hashlib.sha1(key).digest()
+    key = key.ljust(_SHA1_BLOCK, b"\0")
+    return hashlib.sha1(key.translate(_TRANS_36)), hashlib.sha1(key.translate(_TRANS_5C))
+
+
+def generate_totp(secret: str, period: int = 30, digits: int = 6) -> str:
+    """Generate a TOTP code from a base32-encoded secret (RFC 6238)."""
+    counter = (int(time.time()) // period).to_bytes(8, "big")
+    inner_pad, outer_pad = _hmac_sha1_pads(secret)
+    inner = inner_pad.copy()
+    inner.update(counter)
+    outer = outer_pad.copy()
+    outer.update(inner.digest())
+    mac = outer.digest()
+    offset = mac[-1] & 0x0F
+    code = int.from_bytes(mac[offset : offset + 4], "big") & 0x7FFFFFFF
+    return f"{code % _POW10[digits]:0{digits}d}"
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize *obj* to JSON bytes (orjson when available)."""
+    if _HAVE_ORJSON:
+        out: bytes = orjson.dumps(obj)
+        return out
+    return json.dumps(obj).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)."""
+    if _HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Exponential backoff for *attempt*, stretched to a numeric ``Retry-After`` if longer."""
+    delay = _RETRY_BACKOFF_SEC * (1 << attempt)
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, float(retry_after))
+    return delay
+
+
+def post_json(
+    conn: http.client.HTTPSConnection, path: str, payload: dict[str, str], ok_status: tuple[int, ...] = ()
+) -> dict[str, str]:
+    """POST JSON over an open connection and return the parsed response.
+
+    Connection errors and transient statuses (429/502/503/504) are retried up
+    to ``_RETRY_ATTEMPTS`` times with exponential backoff.  Remaining error
+    statuses (>= 400) not listed in *ok_status* are reported and exit the
+    process.  The body is always read fully so *conn* can be reused.
+    """
+    data = _json_dumps(payload)
+    url = f"https://{conn.host}{path}"
+    for attempt in range(_RETRY_ATTEMPTS + 1):
+        try:
+            conn.request("POST", path, body=data, headers={"Content-Type": "application/json"})
+            resp = conn.getresponse()
+            body = resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            # drop the broken socket; http.client reconnects on the next request()
+            conn.close()
+            if attempt == _RETRY_ATTEMPTS:
+                print(f"ERROR: request to {url} failed: {e}", file=sys.stderr)
+                sys.exit(1)
+            time.sleep(_retry_delay(attempt))
+            continue
+        if resp.status in _RETRY_STATUS and attempt < _RETRY_ATTEMPTS:
+            time.sleep(_retry_delay(attempt, resp.getheader("Retry-After")))
+            continue
+        break
+    if resp.status >= 400 and resp.status not in ok_status:
+        print(f"ERROR: HTTP {resp.status} from {url}: {body.decode(errors='replace')}", file=sys.stderr)
         sys.exit(1)
+    result: dict[str, str] = _json_loads(body)
+    return result
 
+
+def _login(conn: http.client.HTTPSConnection, user: str, password: str, totp_secret: str) -> None:
+    """Run the password (and, if required, TOTP) login over *conn* and print the JWT."""
     # Step 1: login with username/password
     # Docker Hub returns HTTP 401 with login_2fa_token when MFA is required
-    login_url = "https://hub.docker.com/v2/users/login/"
-    data = json.dumps({"username": user, "password": password}).encode()
-    req = urllib.request.Request(login_url, data=data, headers={"Content-Type": "application/json"}, method="POST")
-    try:
-        with urllib.request.urlopen(req) as r:
-            resp = json.loads(r.read())
-    except urllib.error.HTTPError as e:
-        body = e.read().decode(errors="replace")
-        if e.code == 401:
-            resp = json.loads(body)
-        else:
-            print(f"ERROR: HTTP {e.code} from {login_url}: {body}", file=sys.stderr)
-            sys.exit(1)
+    resp = post_json(conn, "/v2/users/login/", {"username": user, "password": password}, ok_status=(401,))
 
     token = resp.get("token")
     if token:
@@ -87,10 +157,7 @@ def main() -> None:
 
     code = generate_totp(totp_secret)
     print(f"2FA: submitting TOTP code for {user}", file=sys.stderr)
-    resp = post_json(
-        "https://hub.docker.com/v2/users/2fa-login/",
-        {"login_2fa_token": login_2fa_token, "code": code},
-    )
+    resp = post_json(conn, "/v2/users/2fa-login/", {"login_2fa_token": login_2fa_token, "code": code})
 
     token = resp.get("token")
     if not token:
@@ -100,5 +167,22 @@ def main() -> None:
     print(token)
 
 
+def main() -> None:
+    user = os.environ.get("DOCKERHUB_ADMIN_USER", "")
+    password = os.environ.get("DOCKERHUB_ADMIN_PASSWORD", "")
+    totp_secret = os.environ.get("DOCKERHUB_TOTP_SECRET", "")
+
+    if not user or not password:
+        print("ERROR: DOCKERHUB_ADMIN_USER and DOCKERHUB_ADMIN_PASSWORD must be set", file=sys.stderr)
+        sys.exit(1)
+
+    # One keep-alive connection for both steps, so the 2FA POST reuses the TLS session
+    conn = http.client.HTTPSConnection(_DOCKERHUB_HOST, timeout=30)
+    try:
+        _login(conn, user, password, totp_secret)
+    finally:
+        conn.close()
+
+
 if __name__ == "__main__":
     main()
@@ -19,95 +19,71 @@ Examples:
         --record /data/recordings/recording_$(date +%Y%m%d_%H%M%S).wav
 """
 
-import argparse
-import logging
+import functools
 import sys
-from dataclasses import fields
-from typing import TYPE_CHECKING, Callable
+import types
+import typing
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
-import uvicorn
 from loguru import logger as glogger
-from tabulate import tabulate
 
-from sipstuff_k8s_operator import __version__, configure_logging
+from sipstuff_k8s_operator import __version__
 from sipstuff_k8s_operator.config import OperatorConfig
+from sipstuff_k8s_operator.logsetup import ensure_logging, install_uvicorn_logging
 
 if TYPE_CHECKING:
-    from kubernetes.client import V1Job
+    import argparse
 
-configure_logging()
-glogger.enable("sipstuff_k8s_operator")
+    from fastapi import FastAPI
 
-_uvicorn_logger = glogger.bind(classname="uvicorn")
+_BANNER_ROWS: tuple[tuple[str, str], ...] = (
+    ("version", __version__),
+    ("github", "https://github.com/vroomfondel/sipstuff-k8s-operator"),
+    ("Docker Hub", "https://hub.docker.com/r/xomoxcc/sipstuff-k8s-operator"),
+)
 
 
-class _LoguruInterceptHandler(logging.Handler):
-    """Intercept stdlib logging records and route them through loguru.
+def _format_table(title: str, rows: Sequence[tuple[str, str]]) -> str:
+    """Render *rows* as a two-column box-drawing table with a centered *title* row.
 
-    Installed as the sole handler on uvicorn's loggers so that all uvicorn
-    output is unified under the loguru sink.
+    Produces the same layout as tabulate's ``mixed_grid`` format with an
+    extra title row on top.
+
+    Args:
+        title: Heading shown centered above the key/value rows.
+        rows: ``(key, value)`` string pairs, one per table row.
+
+    Returns:
+        The rendered multi-line table (without trailing newline).
     """
+    kw = max(len(k) for k, _ in rows)
+    vw = max(len(v) for _, v in rows)
+    heavy_k, heavy_v = "\u2501" * (kw + 2), "\u2501" * (vw + 2)
+    light_k, light_v = "\u2500" * (kw + 2), "\u2500" * (vw + 2)
+    row_sep = "\n\u251c" + light_k + "\u253c" + light_v + "\u2524\n"
+    lines = [
+        "\u250d" + "\u2501" * (kw + vw + 5) + "\u2511",
+        "\u2502 " + title.center(kw + vw + 3) + " \u2502",
+        "\u251d" + heavy_k + "\u253f" + heavy_v + "\u2525",
+        row_sep.join(f"\u2502 {k:<{kw}} \u2502 {v:<{vw}} \u2502" for k, v in rows),
+        "\u2515" + heavy_k + "\u2537" + heavy_v + "\u2519",
+    ]
+    return "\n".join(lines)
 
-    def emit(self, record: logging.LogRecord) -> None:
-        """Forward a stdlib ``LogRecord`` to the loguru logger.
 
-        Args:
-            record: The stdlib log record to forward.
-        """
-        level: str | int
-        try:
-            level = glogger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-        _uvicorn_logger.opt(depth=6, exception=record.exc_info).log(level, "{}", record.getMessage())
-
-
-UVICORN_LOG_CONFIG: dict[str, object] = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "handlers": {
-        "loguru": {
-            "()": lambda: _LoguruInterceptHandler(),
-        },
-    },
-    "loggers": {
-        "uvicorn": {
-            "handlers": ["loguru"],
-            "level": "INFO",
-            "propagate": False,
-        },
-        "uvicorn.error": {
-            "handlers": ["loguru"],
-            "level": "INFO",
-            "propagate": False,
-        },
-        "uvicorn.access": {
-            "handlers": ["loguru"],
-            "level": "INFO",
-            "propagate": False,
-        },
-    },
-}
+# everything in the banner is known at import time, so it is rendered once here
+_BANNER = _format_table("sipstuff-k8s-operator starting up", _BANNER_ROWS)
 
 
 def _print_banner() -> None:
     """Log the operator startup banner with version and project links."""
-    startup_rows = [
-        ["version", __version__],
-        ["github", "https://github.com/vroomfondel/sipstuff-k8s-operator"],
-        ["Docker Hub", "https://hub.docker.com/r/xomoxcc/sipstuff-k8s-operator"],
-    ]
-    table_str = tabulate(startup_rows, tablefmt="mixed_grid")
-    lines = table_str.split("\n")
-    table_width = len(lines[0])
-    title = "sipstuff-k8s-operator starting up"
-    title_border = "\u250d" + "\u2501" * (table_width - 2) + "\u2511"
-    title_row = "\u2502 " + title.center(table_width - 4) + " \u2502"
-    separator = lines[0].replace("\u250d", "\u251d").replace("\u2511", "\u2525").replace("\u252f", "\u253f")
-
-    glogger.opt(raw=True).info(
-        "\n{}\n", title_border + "\n" + title_row + "\n" + separator + "\n" + "\n".join(lines[1:])
-    )
+    glogger.opt(raw=True).info("\n{}\n", _BANNER)
+
+
+# (field name, C-level getter) per OperatorConfig field, resolved once at import;
+# dataclass field names are identifiers and therefore already interned
+_CFG_FIELDS = tuple((name, attrgetter(name)) for name in OperatorConfig.__dataclass_fields__)
 
 
 def _print_config(cfg: OperatorConfig) -> None:
@@ -116,39 +92,43 @@ def _print_config(cfg: OperatorConfig) -> None:
     Args:
         cfg: The resolved operator configuration to display.
     """
-    config_table = [[f.name, getattr(cfg, f.name)] for f in fields(cfg)]
-    cfg_table_str = tabulate(config_table, tablefmt="mixed_grid")
-    cfg_lines = cfg_table_str.split("\n")
-    cfg_width = len(cfg_lines[0])
-    cfg_title = "configuration"
-    cfg_title_border = "\u250d" + "\u2501" * (cfg_width - 2) + "\u2511"
-    cfg_title_row = "\u2502 " + cfg_title.center(cfg_width - 4) + " \u2502"
-    cfg_separator = cfg_lines[0].replace("\u250d", "\u251d").replace("\u2511", "\u2525").replace("\u252f", "\u253f")
-
-    glogger.opt(raw=True).info(
-        "\n{}\n",
-        cfg_title_border + "\n" + cfg_title_row + "\n" + cfg_separator + "\n" + "\n".join(cfg_lines[1:]),
-    )
+    rows = [(name, "" if (v := get(cfg)) is None else str(v)) for name, get in _CFG_FIELDS]
+    glogger.opt(raw=True).info("\n{}\n", _format_table("configuration", rows))
+
+
+_CONTAINER_TYPES = (dict, list)
 
 
 def _strip_none(obj: object) -> object:
-    """Recursively remove keys with ``None`` values from nested dicts.
+    """Remove keys with ``None`` values from nested dicts, in place.
+
+    Walks the structure with an explicit stack instead of recursing.  Only
+    ``None`` entries are deleted, so the shared sub-dicts of a
+    :func:`~sipstuff_k8s_operator.job_builder.build_job` manifest (which
+    never holds ``None``) are left untouched.
 
     Args:
         obj: A dict, list, or scalar value to clean.
 
     Returns:
-        A copy of *obj* with all ``None``-valued dict entries removed at every
+        *obj* itself, with all ``None``-valued dict entries removed at every
         nesting level.
     """
-    if isinstance(obj, dict):
-        return {k: _strip_none(v) for k, v in obj.items() if v is not None}
-    if isinstance(obj, list):
-        return [_strip_none(i) for i in obj]
+    # job manifests only hold plain dicts/lists, so exact type checks are enough
+    # and only containers are ever pushed.
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if type(node) is dict:
+            for k in [k for k, v in node.items() if v is None]:
+                del node[k]
+            stack.extend(v for v in node.values() if type(v) in _CONTAINER_TYPES)
+        elif type(node) is list:
+            stack.extend(v for v in node if type(v) in _CONTAINER_TYPES)
     return obj
 
 
-def _is_bool_field(annotation: type | None) -> bool:
+def _is_bool_field(annotation: object) -> bool:
     """Check whether a Pydantic field annotation resolves to ``bool``.
 
     Handles plain ``bool`` as well as ``Union`` / ``X | Y`` types that
@@ -160,9 +140,6 @@ def _is_bool_field(annotation: type | None) -> bool:
     Returns:
         ``True`` if the annotation is or contains ``bool``.
     """
-    import types
-    import typing
-
     if annotation is None:
         return False
     if annotation is bool:
@@ -173,13 +150,79 @@ def _is_bool_field(annotation: type | None) -> bool:
     return False
 
 
+@functools.cache
+def _callrequest_cli_flags() -> dict[str, tuple[str, bool]]:
+    """Map each ``--cli-flag`` to ``(field_name, is_bool)`` for ``CallRequest`` fields.
+
+    Computed once on first use, so the reflection over ``CallRequest`` model
+    fields does not run per invocation and the models module is only
+    imported when a subcommand needs it.
+    """
+    from sipstuff_k8s_operator.models import CallRequest
+
+    return {
+        f"--{name.replace('_', '-')}": (name, _is_bool_field(field_info.annotation))
+        for name, field_info in CallRequest.model_fields.items()
+    }
+
+
+def _split_callrequest_args(
+    args: list[str], parser: "argparse.ArgumentParser"
+) -> tuple[dict[str, str | bool], list[str]]:
+    """Pull ``CallRequest`` field flags out of *args* in a single linear pass.
+
+    Bool fields are value-less switches; every other field takes one value,
+    given either as the next token or inline (``--flag=value``).  Like argparse,
+    a next token starting with ``--`` is never taken as a value — pass such
+    values inline (``--text=--verbose``).  Values stay strings — Pydantic does
+    all type coercion when the request is validated.
+    Everything that is not a ``CallRequest`` flag is returned untouched for
+    *parser* to handle (positional ``IMAGE``, ``--data``, config overrides, …).
+
+    Args:
+        args: Raw CLI argument strings.
+        parser: Parser used to report malformed flags.
+
+    Returns:
+        A tuple of ``(field_values, remaining_args)``.
+    """
+    flags = _callrequest_cli_flags()
+    values: dict[str, str | bool] = {}
+    rest: list[str] = []
+    i = 0
+    while i < len(args):
+        token = args[i]
+        i += 1
+        if token == "--":
+            rest.extend(args[i - 1 :])
+            break
+        flag, has_inline, inline = token.partition("=")
+        spec = flags.get(flag)
+        if spec is None:
+            rest.append(token)
+            continue
+        name, is_bool = spec
+        if is_bool:
+            if has_inline:
+                parser.error(f"argument {flag}: ignored explicit argument {inline!r}")
+            values[name] = True
+        elif has_inline:
+            values[name] = inline
+        elif i < len(args) and not args[i].startswith("--"):
+            values[name] = args[i]
+            i += 1
+        else:
+            parser.error(f"argument {flag}: expected one argument")
+    return values, rest
+
+
 def _build_job_from_args(
     args: list[str], prog: str, extra_args_fn: "Callable[[argparse.ArgumentParser], None] | None" = None
-) -> "tuple[argparse.Namespace, V1Job, OperatorConfig]":
-    """Parse CLI args and build a Kubernetes ``V1Job`` with its config.
+) -> "tuple[argparse.Namespace, dict[str, Any], OperatorConfig]":
+    """Parse CLI args and build a Kubernetes Job manifest with its config.
 
     Shared logic for the ``dumpjob`` and ``startjob`` subcommands.  CLI flags
-    are auto-generated from ``CallRequest`` model fields; an optional
+    are derived from ``CallRequest`` model fields; an optional
     ``--data`` JSON payload is merged with those flags (CLI wins).
 
     Args:
@@ -190,11 +233,12 @@ def _build_job_from_args(
             parsing.
 
     Returns:
-        A tuple of ``(parsed_namespace, v1_job, operator_config)``.
+        A tuple of ``(parsed_namespace, job_manifest, operator_config)``.
 
     Raises:
         SystemExit: If argument parsing or Pydantic validation fails.
     """
+    import argparse
     from dataclasses import replace
 
     from pydantic import ValidationError
@@ -202,7 +246,13 @@ def _build_job_from_args(
     from sipstuff_k8s_operator.job_builder import build_job
     from sipstuff_k8s_operator.models import CallRequest
 
-    parser = argparse.ArgumentParser(prog=prog, description="Build a K8s Job spec from CallRequest parameters")
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Build a K8s Job spec from CallRequest parameters",
+        epilog="CallRequest fields (switches for bool fields, one value otherwise): "
+        + " ".join(_callrequest_cli_flags()),
+        allow_abbrev=False,
+    )
     parser.add_argument("image", nargs="?", default=None, metavar="IMAGE", help="Override job container image")
     parser.add_argument("-d", "--data", default=None, help="JSON string matching the CallRequest schema")
     parser.add_argument("--piper-data-dir", default=None, help="Override host path for Piper TTS model cache")
@@ -215,16 +265,10 @@ def _build_job_from_args(
     if extra_args_fn is not None:
         extra_args_fn(parser)
 
-    # Auto-generate flags from CallRequest model fields — all as strings,
-    # Pydantic handles type coercion and validation.
-    for name, field_info in CallRequest.model_fields.items():
-        cli_flag = f"--{name.replace('_', '-')}"
-        if _is_bool_field(field_info.annotation):
-            parser.add_argument(cli_flag, action="store_true", default=None, help=f"Set {name}")
-        else:
-            parser.add_argument(cli_flag, default=None, help=f"Set {name}")
-
-    parsed = parser.parse_args(args)
+    # CallRequest fields are swept out of argv by hand; argparse only sees the
+    # handful of operator-level flags above.
+    cli_fields, rest = _split_callrequest_args(args, parser)
+    parsed = parser.parse_args(rest)
 
     # Build merged dict: validate --data through Pydantic, then overlay CLI flags
     merged: dict[str, str | bool | dict[str, str]] = {}
@@ -235,10 +279,7 @@ def _build_job_from_args(
             parser.error(f"--data JSON validation failed:\n{exc}")
         merged.update(base.model_dump(exclude_unset=True))
 
-    for name in CallRequest.model_fields:
-        cli_val: str | bool | None = getattr(parsed, name, None)
-        if cli_val is not None:
-            merged[name] = cli_val
+    merged.update(cli_fields)
 
     # Convert --node-selector string to dict (e.g. "key=val,k2=v2" → dict)
     if "node_selector" in merged and isinstance(merged["node_selector"], str):
@@ -283,25 +324,39 @@ def dumpjob(args: list[str]) -> None:
     Args:
         args: CLI arguments forwarded from the ``dumpjob`` subcommand.
     """
-    import json as json_mod
+    ensure_logging()
+
+    def _add_output_flag(parser: "argparse.ArgumentParser") -> None:
+        """Register the ``--json-output`` flag (alias ``--json``) on *parser*.
 
-    def _add_output_flag(parser: argparse.ArgumentParser) -> None:
-        """Register the ``--json-output`` flag on *parser*.
+        The parser disables prefix matching, so the documented short form
+        ``--json`` is registered explicitly.
 
         Args:
             parser: The argument parser to extend.
         """
-        parser.add_argument("--json-output", action="store_true", help="Output JSON instead of YAML")
+        parser.add_argument("--json-output", "--json", action="store_true", help="Output JSON instead of YAML")
 
     parsed, job, _cfg = _build_job_from_args(args, prog="sipstuff-operator dumpjob", extra_args_fn=_add_output_flag)
-    data = _strip_none(job.to_dict())
+    data = _strip_none(job)
 
     if parsed.json_output:
-        print(json_mod.dumps(data, indent=2, default=str))
+        import orjson
+
+        sys.stdout.buffer.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2) + b"\n")
     else:
         import yaml
 
-        print(yaml.dump(data, default_flow_style=False, sort_keys=False))
+        # libyaml-backed emitter when PyYAML was built with it (the PyPI wheels are)
+        base_dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+        class _NoAliasDumper(base_dumper):  # type: ignore[misc,valid-type]
+            """Write shared objects (e.g. the containers' common volumeMounts) out in full, not as anchors."""
+
+            def ignore_aliases(self, data: Any) -> bool:
+                return True
+
+        print(yaml.dump(data, Dumper=_NoAliasDumper, default_flow_style=False, sort_keys=False))
 
 
 def startjob(args: list[str]) -> None:
@@ -316,6 +371,7 @@ def startjob(args: list[str]) -> None:
     from kubernetes import client as k8s_client
     from kubernetes import config as k8s_config
 
+    ensure_logging()
     _parsed, job, cfg = _build_job_from_args(args, prog="sipstuff-operator startjob")
 
     try:
@@ -326,9 +382,10 @@ def startjob(args: list[str]) -> None:
         glogger.info("Loaded local kubeconfig")
 
     batch_api = k8s_client.BatchV1Api()
-    glogger.info("Creating job {} in namespace {}", job.metadata.name, cfg.namespace)
-    batch_api.create_namespaced_job(namespace=cfg.namespace, body=job)
-    glogger.info("Job {} created successfully", job.metadata.name)
+    glogger.info("Creating job {} in namespace {}", job["metadata"]["name"], cfg.namespace)
+    # the client takes a plain manifest dict as well as a V1Job model
+    batch_api.create_namespaced_job(namespace=cfg.namespace, body=job)  # type: ignore[arg-type]
+    glogger.info("Job {} created successfully", job["metadata"]["name"])
 
 
 def conntest() -> None:
@@ -340,6 +397,8 @@ def conntest() -> None:
     from kubernetes import client as k8s_client
     from kubernetes import config as k8s_config
 
+    ensure_logging()
+
     try:
         in_cluster = False
         try:
@@ -375,8 +434,13 @@ def main() -> None:
     """Start the sipstuff-k8s-operator HTTP server.
 
     Prints the startup banner and configuration, creates the FastAPI
-    application, and launches uvicorn on the configured port.
+    application, and launches uvicorn on the configured port (uvicorn picks
+    uvloop and httptools itself when they are installed).  With
+    ``WEB_CONCURRENCY`` > 1 uvicorn spawns that many worker processes, each
+    building its own app via
+    :func:`~sipstuff_k8s_operator.operator.create_app_factory`.
     """
+    ensure_logging()
     _print_banner()
 
     try:
@@ -386,18 +450,36 @@ def main() -> None:
         glogger.error("Configuration error: {}", exc)
         sys.exit(1)
 
+    import uvicorn
+
     from sipstuff_k8s_operator.operator import create_app
 
-    app = create_app(cfg)
-    uvicorn.run(app, host="0.0.0.0", port=cfg.port, log_level="info", access_log=True, log_config=UVICORN_LOG_CONFIG)
+    # worker processes need an importable target, not an app built in this process
+    app: FastAPI | str = "sipstuff_k8s_operator.operator:create_app_factory" if cfg.workers > 1 else create_app(cfg)
+    install_uvicorn_logging()
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=cfg.port,
+        workers=cfg.workers,
+        factory=cfg.workers > 1,
+        log_level="info",
+        access_log=False,
+        log_config=None,
+    )
+
+
+# Subcommand name -> handler taking the remaining argv; anything else starts the server
+_SUBCMDS: dict[str, Callable[[list[str]], None]] = {
+    "conntest": lambda _args: conntest(),
+    "dumpjob": dumpjob,
+    "startjob": startjob,
+}
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1 and sys.argv[1] == "conntest":
-        conntest()
-    elif len(sys.argv) > 1 and sys.argv[1] == "dumpjob":
-        dumpjob(sys.argv[2:])
-    elif len(sys.argv) > 1 and sys.argv[1] == "startjob":
-        startjob(sys.argv[2:])
-    else:
+    cmd = _SUBCMDS.get(sys.argv[1]) if len(sys.argv) > 1 else None
+    if cmd is None:
         main()
+    else:
+        cmd(sys.argv[2:])
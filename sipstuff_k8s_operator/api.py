@@ -1,17 +1,22 @@
 """FastAPI router with SIP call job endpoints."""
 
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, cast
 
-from fastapi import APIRouter, HTTPException, Request
-from kubernetes.client import BatchV1Api
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from kubernetes_asyncio.client import BatchV1Api
+from kubernetes_asyncio.client.exceptions import ApiException
+from kubernetes_asyncio.client.rest import RESTResponse
 from loguru import logger as glogger
 
 from sipstuff_k8s_operator import __version__
-from sipstuff_k8s_operator.job_builder import build_job
+from sipstuff_k8s_operator.informer import JOB_LABEL_SELECTOR, JobInformer, job_info, job_info_from_json
 from sipstuff_k8s_operator.models import CallRequest, CallResponse, HealthResponse, JobInfo
 
 if TYPE_CHECKING:
+    from aiohttp import ClientResponse
+
     from sipstuff_k8s_operator.config import OperatorConfig
 
 logger = glogger.bind(classname="api")
@@ -23,87 +28,106 @@ def _get_config(request: Request) -> OperatorConfig:
     return request.app.state.config  # type: ignore[no-any-return]
 
 
+def _get_job_builder(request: Request) -> Callable[[CallRequest], dict[str, Any]]:
+    return request.app.state.build_job  # type: ignore[no-any-return]
+
+
 def _get_batch_api(request: Request) -> BatchV1Api:
-    return request.app.state.batch_api
+    return request.app.state.batch_api  # type: ignore[no-any-return]
+
 
+def _get_informer(request: Request) -> JobInformer:
+    return request.app.state.job_informer  # type: ignore[no-any-return]
 
-def _job_status(job: object) -> str:
-    """Derive a human-readable status string from a V1Job object."""
-    status = getattr(job, "status", None)
-    if status is None:
-        return "unknown"
-    if getattr(status, "succeeded", None) and status.succeeded > 0:
-        return "succeeded"
-    if getattr(status, "failed", None) and status.failed > 0:
-        return "failed"
-    if getattr(status, "active", None) and status.active > 0:
-        return "running"
-    return "pending"
 
+# The probe body never changes, so it is validated and encoded once at import
+_HEALTH_BODY = orjson.dumps(HealthResponse(status="ok", version=__version__))
 
-@router.get("/health", response_model=HealthResponse)
-def health() -> HealthResponse:
+
+@router.get("/health", response_class=Response, responses={200: {"model": HealthResponse}})
+async def health() -> Response:
     """Liveness / readiness probe."""
-    return HealthResponse(status="ok", version=__version__)
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
 
+@router.post("/call", status_code=201, response_class=Response, responses={201: {"model": CallResponse}})
+async def create_call(body: CallRequest, request: Request) -> Response:
+    """Create a K8s Job that executes a SIP call.
 
-@router.post("/call", response_model=CallResponse, status_code=201)
-def create_call(body: CallRequest, request: Request) -> CallResponse:
-    """Create a K8s Job that executes a SIP call."""
+    The :class:`CallResponse` is built here from trusted values, so it is
+    encoded straight to JSON instead of going through response validation.
+    """
     config = _get_config(request)
     batch_api = _get_batch_api(request)
 
-    job = build_job(body, config)
-    logger.debug("Job spec:\n{}", json.dumps(job.to_dict(), indent=2, default=str))
-    logger.info("Creating job {} in namespace {}", job.metadata.name, config.namespace)
-
-    batch_api.create_namespaced_job(namespace=config.namespace, body=job)
-
-    return CallResponse(job_name=job.metadata.name, namespace=config.namespace, status="created")
+    job = _get_job_builder(request)(body)
+    # lazy: the dict walk + dump only runs when a sink actually accepts DEBUG
+    logger.opt(lazy=True).debug("Job spec:\n{}", lambda: json.dumps(job, indent=2))
+    logger.info("Creating job {} in namespace {}", job["metadata"]["name"], config.namespace)
+
+    # raw response: only a JobInfo is needed from it, so skip the client's
+    # recursive V1Job deserialization and decode the body with orjson instead.
+    # The client takes a plain manifest dict as well as a V1Job model.
+    resp = cast(
+        "ClientResponse",
+        await batch_api.create_namespaced_job(
+            namespace=config.namespace, body=job, _preload_content=False  # type: ignore[arg-type]
+        ),
+    )
+    data = await resp.read()
+    if not 200 <= resp.status <= 299:
+        # same error the client raises when it reads the body itself
+        raise ApiException(http_resp=RESTResponse(resp, data))  # type: ignore[arg-type]
+    # visible to GET /jobs right away, without waiting for the watch event
+    _get_informer(request).put(job_info_from_json(orjson.loads(data)))
+
+    return Response(
+        content=orjson.dumps(
+            CallResponse(job_name=job["metadata"]["name"], namespace=config.namespace, status="created")
+        ),
+        status_code=201,
+        media_type="application/json",
+    )
 
 
 @router.get("/jobs", response_model=list[JobInfo])
-def list_jobs(request: Request) -> list[JobInfo]:
-    """List SIP call jobs."""
+async def list_jobs(request: Request) -> list[JobInfo]:
+    """List SIP call jobs (from the informer's mirror once it has synced)."""
+    informer = _get_informer(request)
+    if informer.synced:
+        return list(informer.jobs.values())
+
     config = _get_config(request)
     batch_api = _get_batch_api(request)
-
-    result = batch_api.list_namespaced_job(
+    result = await batch_api.list_namespaced_job(
         namespace=config.namespace,
-        label_selector="app=sipstuff-operator",
+        label_selector=JOB_LABEL_SELECTOR,
     )
-
-    jobs: list[JobInfo] = []
-    for item in result.items:
-        jobs.append(
-            JobInfo(
-                name=item.metadata.name,
-                namespace=item.metadata.namespace,
-                status=_job_status(item),
-                created_at=item.metadata.creation_timestamp,
-                completed_at=getattr(item.status, "completion_time", None),
-            )
-        )
-    return jobs
+    return [job_info(item) for item in result.items]
 
 
 @router.get("/jobs/{job_name}", response_model=JobInfo)
-def get_job(job_name: str, request: Request) -> JobInfo:
-    """Get status of a specific SIP call job."""
+async def get_job(job_name: str, request: Request) -> JobInfo:
+    """Get status of a specific SIP call job.
+
+    Served from the informer's mirror once it has synced; unknown names (not
+    yet seen, or jobs outside the operator's label selector) and an unsynced
+    (possibly stale) mirror fall back to a direct read.
+    """
+    informer = _get_informer(request)
+    if informer.synced:
+        info = informer.jobs.get(job_name)
+        if info is not None:
+            return info
+
     config = _get_config(request)
     batch_api = _get_batch_api(request)
 
     try:
-        item = batch_api.read_namespaced_job(name=job_name, namespace=config.namespace)
-    except Exception as exc:
-        if "404" in str(exc) or "Not Found" in str(exc):
+        item = await batch_api.read_namespaced_job(name=job_name, namespace=config.namespace)
+    except ApiException as exc:
+        if exc.status == 404:
             raise HTTPException(status_code=404, detail=f"Job '{job_name}' not found") from exc
         raise
 
-    return JobInfo(
-        name=item.metadata.name,
-        namespace=item.metadata.namespace,
-        status=_job_status(item),
-        created_at=item.metadata.creation_timestamp,
-        completed_at=getattr(item.status, "completion_time", None),
-    )
+    return job_info(item)
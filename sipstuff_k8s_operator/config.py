@@ -1,12 +1,15 @@
 """Operator configuration loaded from environment variables."""
 
+import functools
 import os
 from dataclasses import dataclass
 
+_TRUTHY = frozenset(("true", "1", "yes"))
+
 
 def _parse_bool(value: str) -> bool:
     """Parse a string into a boolean (truthy: ``"true"``, ``"1"``, ``"yes"``)."""
-    return value.strip().lower() in ("true", "1", "yes")
+    return value.strip().lower() in _TRUTHY
 
 
 def parse_node_selector(value: str) -> dict[str, str]:
@@ -48,11 +51,17 @@ class OperatorConfig:
     run_as_group: int | None
     fs_group: int | None
     node_selector: dict[str, str] | None
+    workers: int = 1
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> OperatorConfig:
         """Build an :class:`OperatorConfig` from environment variables.
 
+        The result is cached per process (the config is immutable and the
+        environment is not expected to change); call
+        ``OperatorConfig.from_env.cache_clear()`` to force a re-read.
+
         Environment variables
         ---------------------
         JOB_NAMESPACE : str, optional
@@ -84,6 +93,11 @@ class OperatorConfig:
             GID to run the job container as (default ``None``).
         FS_GROUP : str, optional
             fsGroup for the job pod security context (default ``None``).
+        NODE_SELECTOR : str, optional
+            Default node selector for job pods, ``key=value,key2=value2``
+            (default ``None``).
+        WEB_CONCURRENCY : str, optional
+            Number of uvicorn worker processes (default ``1``; empty means unset).
         """
         default_namespace = "sipstuff"
         ns_file = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
@@ -106,4 +120,5 @@ class OperatorConfig:
             run_as_group=int(v) if (v := os.environ.get("RUN_AS_GROUP")) else None,
             fs_group=int(v) if (v := os.environ.get("FS_GROUP")) else None,
             node_selector=parse_node_selector(v) if (v := os.environ.get("NODE_SELECTOR")) else None,
+            workers=max(1, int(v)) if (v := os.environ.get("WEB_CONCURRENCY")) else 1,
         )
@@ -0,0 +1,205 @@
+"""Watch-backed in-memory mirror of the operator's SIP call jobs."""
+
+import asyncio
+import contextlib
+from datetime import datetime
+from operator import attrgetter
+from typing import Any
+
+from kubernetes_asyncio import watch
+from kubernetes_asyncio.client import BatchV1Api
+from kubernetes_asyncio.client.exceptions import ApiException
+from loguru import logger as glogger
+
+from sipstuff_k8s_operator.models import JobInfo
+
+logger = glogger.bind(classname="informer")
+
+# Label selector matching every job created by the operator
+JOB_LABEL_SELECTOR = "app=sipstuff-operator"
+
+_RETRY_MIN_SEC = 1.0
+_RETRY_MAX_SEC = 30.0
+
+
+# (name, namespace, creationTimestamp, status) of a V1Job in one C-level call
+_JOB_ATTRS = attrgetter("metadata.name", "metadata.namespace", "metadata.creation_timestamp", "status")
+
+
+def _status_label(succeeded: int | None, failed: int | None, active: int | None) -> str:
+    """Derive a human-readable status string from a job's pod counts."""
+    if succeeded and succeeded > 0:
+        return "succeeded"
+    if failed and failed > 0:
+        return "failed"
+    if active and active > 0:
+        return "running"
+    return "pending"
+
+
+def _status_from(status: Any) -> str:
+    """Derive a human-readable status string from a job's already-fetched ``V1JobStatus``."""
+    if status is None:
+        return "unknown"
+    return _status_label(status.succeeded, status.failed, status.active)
+
+
+def job_info(item: Any) -> JobInfo:
+    """Convert a V1Job object into the API's :class:`JobInfo`."""
+    name, namespace, created_at, status = _JOB_ATTRS(item)
+    return JobInfo(
+        name=name,
+        namespace=namespace,
+        status=_status_from(status),
+        created_at=created_at,
+        completed_at=getattr(status, "completion_time", None),
+    )
+
+
+def job_info_from_json(obj: dict[str, Any]) -> JobInfo:
+    """Convert a job as decoded from raw API JSON (camelCase keys) into :class:`JobInfo`.
+
+    Counterpart of :func:`job_info` for responses read with
+    ``_preload_content=False``, which skip the client's ``V1Job`` deserialization.
+    """
+    metadata = obj["metadata"]
+    created_at = metadata.get("creationTimestamp")
+    status = obj.get("status")
+    if status is None:
+        label, completed_at = "unknown", None
+    else:
+        label = _status_label(status.get("succeeded"), status.get("failed"), status.get("active"))
+        completed_at = status.get("completionTime")
+    return JobInfo(
+        name=metadata["name"],
+        namespace=metadata["namespace"],
+        status=label,
+        created_at=datetime.fromisoformat(created_at) if created_at else None,
+        completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+    )
+
+
+class JobInformer:
+    """List+watch the operator's jobs and keep a ``name -> JobInfo`` map current.
+
+    A background task lists the jobs once, then follows the watch stream from
+    the list's ``resourceVersion``.  A stream that simply ends is re-entered
+    from the last ``resourceVersion`` it delivered (events and bookmarks).
+    When the server reports the version as expired (410 Gone) the map is
+    rebuilt from a fresh list; other failures are retried with exponential
+    backoff.  While no list has succeeded (or after a failure) :attr:`synced`
+    is ``False`` and callers should go to the API directly.
+    """
+
+    def __init__(self, batch_api: BatchV1Api, namespace: str, label_selector: str = JOB_LABEL_SELECTOR) -> None:
+        """Create an idle informer; call :meth:`start` to begin watching.
+
+        Args:
+            batch_api: asyncio ``BatchV1Api`` used for list and watch calls.
+            namespace: Namespace whose jobs are mirrored.
+            label_selector: Selector restricting the mirrored jobs.
+        """
+        self.batch_api = batch_api
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.jobs: dict[str, JobInfo] = {}
+        self.synced = False
+        self._task: asyncio.Task[None] | None = None
+        # Jobs put() while a relist is in flight; merged into the fresh list
+        self._put_during_relist: dict[str, JobInfo] | None = None
+
+    def start(self) -> None:
+        """Start the background list+watch task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="job-informer")
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self.synced = False
+
+    def upsert(self, item: Any) -> None:
+        """Record a ``V1Job`` (from a watch event or a direct API read)."""
+        self.put(job_info(item))
+
+    def put(self, info: JobInfo) -> None:
+        """Record a job right away (e.g. one just created), ahead of its watch event."""
+        self.jobs[info.name] = info
+        if self._put_during_relist is not None:
+            self._put_during_relist[info.name] = info
+
+    def apply(self, event_type: str, item: Any) -> None:
+        """Apply one watch event (``ADDED``/``MODIFIED``/``DELETED``) to the map."""
+        if event_type == "DELETED":
+            self.jobs.pop(item.metadata.name, None)
+        elif event_type in ("ADDED", "MODIFIED"):
+            self.upsert(item)
+
+    async def _relist(self) -> str:
+        """Replace the map with a fresh list and return its ``resourceVersion``.
+
+        Jobs :meth:`put` while the list call is in flight may be missing from
+        its snapshot; they are kept unless the list already has them (its copy
+        is at least as new as the create response).
+        """
+        self._put_during_relist = {}
+        try:
+            result = await self.batch_api.list_namespaced_job(
+                namespace=self.namespace,
+                label_selector=self.label_selector,
+            )
+            jobs = {info.name: info for info in map(job_info, result.items)}
+            for name, info in self._put_during_relist.items():
+                jobs.setdefault(name, info)
+        finally:
+            self._put_during_relist = None
+        self.jobs = jobs
+        self.synced = True
+        logger.debug("Job informer synced {} job(s) in {}", len(self.jobs), self.namespace)
+        return str(result.metadata.resource_version)
+
+    async def _watch(self, resource_version: str) -> str:
+        """Follow the watch stream from *resource_version* and return the last version seen.
+
+        Every event, bookmarks included, advances the returned version, so the
+        caller can resume the watch where the stream ended.
+        """
+        async with watch.Watch().stream(
+            self.batch_api.list_namespaced_job,
+            namespace=self.namespace,
+            label_selector=self.label_selector,
+            resource_version=resource_version,
+            allow_watch_bookmarks=True,
+        ) as stream:
+            async for event in stream:
+                resource_version = event["raw_object"]["metadata"]["resourceVersion"]
+                self.apply(event["type"], event["object"])
+        return resource_version
+
+    async def _run(self) -> None:
+        delay = _RETRY_MIN_SEC
+        resource_version: str | None = None
+        while True:
+            try:
+                if resource_version is None:
+                    resource_version = await self._relist()
+                    delay = _RETRY_MIN_SEC
+                # A stream that ends without error is resumed where it stopped
+                resource_version = await self._watch(resource_version)
+                continue
+            except ApiException as exc:
+                resource_version = None
+                if exc.status == 410:
+                    logger.info("Job watch resourceVersion expired, relisting")
+                    continue
+                logger.warning("Job informer API error ({}), retrying in {:.0f}s", exc.status, delay)
+            except Exception as exc:
+                resource_version = None
+                logger.warning("Job informer failed ({}), retrying in {:.0f}s", exc, delay)
+            self.synced = False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RETRY_MAX_SEC)
@@ -1,25 +1,18 @@
-"""Build Kubernetes Job specs for SIP calls."""
-
-import random
-import string
-from datetime import datetime, timezone
-
-from kubernetes.client import (
-    V1Container,
-    V1EnvVar,
-    V1EnvVarSource,
-    V1HostPathVolumeSource,
-    V1Job,
-    V1JobSpec,
-    V1ObjectMeta,
-    V1PodSecurityContext,
-    V1PodSpec,
-    V1PodTemplateSpec,
-    V1SecretKeySelector,
-    V1SecurityContext,
-    V1Volume,
-    V1VolumeMount,
-)
+"""Build Kubernetes Job specs for SIP calls.
+
+Jobs are built as plain ``batch/v1`` manifest dicts (camelCase keys, unset
+fields omitted) rather than kubernetes client model objects: both the sync
+and the asyncio ``BatchV1Api`` accept a dict body and only serialize it.
+"""
+
+import functools
+import operator
+import os
+import time
+import types
+import typing
+from dataclasses import dataclass
+from typing import Any, Callable, Literal
 
 from sipstuff_k8s_operator.config import OperatorConfig
 from sipstuff_k8s_operator.models import CallRequest
@@ -29,218 +22,321 @@ _WHISPER_MOUNT_PATH = "/data/whisper"
 _RECORDING_MOUNT_PATH = "/data/recordings"
 
 
-def _generate_job_name() -> str:
-    """Generate a unique job name like ``sipcall-20260208-1430-a7f3``."""
-    now = datetime.now(timezone.utc)
-    suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=4))
-    return f"sipcall-{now.strftime('%Y%m%d-%H%M')}-{suffix}"
-
+_JOB_NAME_TIME_FMT = "sipcall-%Y%m%d-%H%M-"
 
-def _secret_env(name: str, secret_name: str, key: str) -> V1EnvVar:
-    """Create an env var sourced from a K8s Secret key."""
-    return V1EnvVar(
-        name=name,
-        value_from=V1EnvVarSource(secret_key_ref=V1SecretKeySelector(name=secret_name, key=key, optional=True)),
-    )
+# (formatted name prefix, epoch second at which it goes stale)
+_job_name_prefix: tuple[str, float] = ("", 0.0)
 
 
-def build_job(request: CallRequest, config: OperatorConfig) -> V1Job:
-    """Construct a :class:`V1Job` for executing a SIP call.
-
-    When ``piper_data_dir``, ``whisper_data_dir``, or ``recording_dir`` are set
-    on *config*, corresponding ``hostPath`` volumes (``DirectoryOrCreate``) are
-    created and mounted at ``/data/piper``, ``/data/whisper``, and
-    ``/data/recordings`` respectively.  Container env vars point to the mount
-    paths (not the host paths).
-
-    When ``record`` is set on *request*, ``--record <path>`` is passed to the
-    ``sipstuff.cli call`` command (the path should point inside the recording
-    volume, e.g. ``/data/recordings/call.wav``).
+def _generate_job_name() -> str:
+    """Generate a unique job name like ``sipcall-20260208-1430-a7f3`` (UTC minute + 4 hex chars).
 
-    If any of ``run_as_user``, ``run_as_group``, or ``fs_group`` are set on
-    *config*, a ``PodSecurityContext`` is added to the pod spec.
+    The minute prefix is formatted once per UTC minute and reused until the
+    next minute boundary.
     """
-    args: list[str] = ["python3", "-m", "sipstuff.cli", "call", "--dest", request.dest]
-
-    if request.text:
-        args.extend(["--text", request.text])
-    if request.wav:
-        args.extend(["--wav", request.wav])
-
-    args.extend(["--timeout", str(request.timeout)])
-
-    if request.pre_delay > 0:
-        args.extend(["--pre-delay", str(request.pre_delay)])
-    if request.inter_delay > 0:
-        args.extend(["--inter-delay", str(request.inter_delay)])
-    if request.post_delay > 0:
-        args.extend(["--post-delay", str(request.post_delay)])
-    if request.wait_for_silence is not None:
-        args.extend(["--wait-for-silence", str(request.wait_for_silence)])
-    if request.repeat > 1:
-        args.extend(["--repeat", str(request.repeat)])
-
-    if request.tts_model:
-        args.extend(["--piper-model", request.tts_model])
-    if request.tts_sample_rate is not None:
-        args.extend(["--tts-sample-rate", str(request.tts_sample_rate)])
-    if request.tts_data_dir:
-        args.extend(["--tts-data-dir", request.tts_data_dir])
-
-    if request.stt_model:
-        args.extend(["--stt-model", request.stt_model])
-    if request.stt_language:
-        args.extend(["--stt-language", request.stt_language])
-    if request.stt_data_dir:
-        args.extend(["--stt-data-dir", request.stt_data_dir])
-
-    if request.transcribe:
-        args.append("--transcribe")
-
-    if request.verbose:
-        args.append("--verbose")
-
-    # Environment variables for SIP connection
-    env_vars: list[V1EnvVar] = []
-
-    # For each SIP param: use request override if provided, otherwise reference the secret
-    sip_fields = [
-        ("SIP_SERVER", "sip_server", "SIP_SERVER"),
-        ("SIP_PORT", "sip_port", "SIP_PORT"),
-        ("SIP_USER", "sip_user", "SIP_USER"),
-        ("SIP_PASSWORD", "sip_password", "SIP_PASSWORD"),
-        ("SIP_TRANSPORT", "sip_transport", "SIP_TRANSPORT"),
-        ("SIP_SRTP", "sip_srtp", "SIP_SRTP"),
-    ]
-
-    for env_name, attr_name, secret_key in sip_fields:
-        val = getattr(request, attr_name)
-        if val is not None:
-            env_vars.append(V1EnvVar(name=env_name, value=str(val)))
-        else:
-            env_vars.append(_secret_env(env_name, config.sip_secret_name, secret_key))
-
-    # SIP TLS verification (bool → "true"/"false" string)
-    if request.sip_tls_verify is not None:
-        env_vars.append(V1EnvVar(name="SIP_TLS_VERIFY_SERVER", value=str(request.sip_tls_verify).lower()))
-    else:
-        env_vars.append(_secret_env("SIP_TLS_VERIFY_SERVER", config.sip_secret_name, "SIP_TLS_VERIFY_SERVER"))
-
-    # NAT traversal env vars (same secret-fallback pattern)
-    nat_fields: list[tuple[str, str, str]] = [
-        ("SIP_STUN_SERVERS", "stun_servers", "SIP_STUN_SERVERS"),
-        ("SIP_ICE_ENABLED", "ice_enabled", "SIP_ICE_ENABLED"),
-        ("SIP_TURN_SERVER", "turn_server", "SIP_TURN_SERVER"),
-        ("SIP_TURN_USERNAME", "turn_username", "SIP_TURN_USERNAME"),
-        ("SIP_TURN_PASSWORD", "turn_password", "SIP_TURN_PASSWORD"),
-        ("SIP_TURN_TRANSPORT", "turn_transport", "SIP_TURN_TRANSPORT"),
-        ("SIP_KEEPALIVE_SEC", "keepalive_sec", "SIP_KEEPALIVE_SEC"),
-        ("SIP_PUBLIC_ADDRESS", "public_address", "SIP_PUBLIC_ADDRESS"),
-    ]
-
-    for env_name, attr_name, secret_key in nat_fields:
-        val = getattr(request, attr_name)
-        if val is not None:
-            if isinstance(val, bool):
-                env_vars.append(V1EnvVar(name=env_name, value=str(val).lower()))
-            else:
-                env_vars.append(V1EnvVar(name=env_name, value=str(val)))
-        else:
-            env_vars.append(_secret_env(env_name, config.sip_secret_name, secret_key))
-
-    # When turn_server is provided, implicitly enable TURN
-    if request.turn_server is not None:
-        env_vars.append(V1EnvVar(name="SIP_TURN_ENABLED", value="true"))
-
-    # Volume mounts for model cache and recording directories
-    volumes: list[V1Volume] = []
-    volume_mounts: list[V1VolumeMount] = []
+    global _job_name_prefix
+    now = time.time()
+    prefix, stale_at = _job_name_prefix
+    if now >= stale_at:
+        prefix = time.strftime(_JOB_NAME_TIME_FMT, time.gmtime(now))
+        _job_name_prefix = (prefix, (now // 60 + 1) * 60)
+    return prefix + os.urandom(2).hex()
+
+
+_JOB_LABELS: dict[str, str] = {"app": "sipstuff-operator", "component": "sip-caller"}
+
+
+@dataclass(frozen=True)
+class _JobSkeleton:
+    """Config-derived parts of a job spec, shared (read-only) by every job built from the same config."""
+
+    volumes: tuple[dict[str, Any], ...]
+    volume_mounts: tuple[dict[str, Any], ...]
+    mount_env: tuple[dict[str, Any], ...]
+    security_context: dict[str, Any] | None
+    init_containers: tuple[dict[str, Any], ...]
+
+
+@functools.lru_cache(maxsize=8)
+def _job_skeleton(
+    piper_data_dir: str | None,
+    whisper_data_dir: str | None,
+    recording_dir: str | None,
+    run_as_user: int | None,
+    run_as_group: int | None,
+    fs_group: int | None,
+) -> _JobSkeleton:
+    """Build the volumes, mounts, mount env vars, security context and initContainers for a config.
+
+    Keyed on the scalar :class:`OperatorConfig` fields involved (the config
+    itself is unhashable because of ``node_selector``), so it runs once per
+    distinct config rather than once per job.
+    """
+    volumes: list[dict[str, Any]] = []
+    volume_mounts: list[dict[str, Any]] = []
+    mount_env: list[dict[str, Any]] = []
 
     _dir_mappings: list[tuple[str | None, str, str, str]] = [
-        (config.piper_data_dir, "piper-data", _PIPER_MOUNT_PATH, "PIPER_DATA_DIR"),
-        (config.whisper_data_dir, "whisper-data", _WHISPER_MOUNT_PATH, "WHISPER_DATA_DIR"),
-        (config.recording_dir, "recording-data", _RECORDING_MOUNT_PATH, "RECORDING_DIR"),
+        (piper_data_dir, "piper-data", _PIPER_MOUNT_PATH, "PIPER_DATA_DIR"),
+        (whisper_data_dir, "whisper-data", _WHISPER_MOUNT_PATH, "WHISPER_DATA_DIR"),
+        (recording_dir, "recording-data", _RECORDING_MOUNT_PATH, "RECORDING_DIR"),
     ]
 
     for host_path, vol_name, mount_path, env_name in _dir_mappings:
         if host_path is not None:
-            volumes.append(
-                V1Volume(name=vol_name, host_path=V1HostPathVolumeSource(path=host_path, type="DirectoryOrCreate"))
-            )
-            volume_mounts.append(V1VolumeMount(name=vol_name, mount_path=mount_path))
-            env_vars.append(V1EnvVar(name=env_name, value=mount_path))
-
-    # CLI arg for recording (per-call file path inside the recording volume)
-    if request.record is not None:
-        args.extend(["--record", request.record])
-
-    job_name = _generate_job_name()
-
-    container = V1Container(
-        name="sip-caller",
-        image=config.job_image,
-        image_pull_policy="Always",
-        command=args,
-        env=env_vars,
-        volume_mounts=volume_mounts or None,
-    )
+            volumes.append({"name": vol_name, "hostPath": {"path": host_path, "type": "DirectoryOrCreate"}})
+            volume_mounts.append({"name": vol_name, "mountPath": mount_path})
+            mount_env.append({"name": env_name, "value": mount_path})
 
     # Pod security context (optional, from operator config)
-    security_context: V1PodSecurityContext | None = None
-    if config.run_as_user is not None or config.run_as_group is not None or config.fs_group is not None:
-        security_context = V1PodSecurityContext(
-            run_as_user=config.run_as_user,
-            run_as_group=config.run_as_group,
-            fs_group=config.fs_group,
-        )
+    security_context: dict[str, Any] | None = None
+    if run_as_user is not None or run_as_group is not None or fs_group is not None:
+        security_context = {
+            key: val
+            for key, val in (("runAsUser", run_as_user), ("runAsGroup", run_as_group), ("fsGroup", fs_group))
+            if val is not None
+        }
 
     # initContainer to fix hostPath ownership (fsGroup does not apply to hostPath volumes)
-    init_containers: list[V1Container] | None = None
-    if volume_mounts and config.run_as_user is not None:
-        owner = str(config.run_as_user)
-        if config.fs_group is not None:
-            owner += f":{config.fs_group}"
-        elif config.run_as_group is not None:
-            owner += f":{config.run_as_group}"
-        dirs = " ".join(vm.mount_path for vm in volume_mounts)
-        init_containers = [
-            V1Container(
-                name="fix-permissions",
-                image="busybox:latest",
-                command=["sh", "-c", f"chown -R {owner} {dirs}"],
-                volume_mounts=list(volume_mounts),
-                security_context=V1SecurityContext(run_as_user=0),
-            )
-        ]
-
-    pod_spec = V1PodSpec(
-        containers=[container],
-        init_containers=init_containers,
-        restart_policy="Never",
-        host_network=config.host_network,
-        volumes=volumes or None,
+    init_containers: list[dict[str, Any]] = []
+    if volume_mounts and run_as_user is not None:
+        owner = str(run_as_user)
+        if fs_group is not None:
+            owner += f":{fs_group}"
+        elif run_as_group is not None:
+            owner += f":{run_as_group}"
+        dirs = " ".join(vm["mountPath"] for vm in volume_mounts)
+        init_containers.append(
+            {
+                "name": "fix-permissions",
+                "image": "busybox:latest",
+                "command": ["sh", "-c", f"chown -R {owner} {dirs}"],
+                "volumeMounts": list(volume_mounts),
+                "securityContext": {"runAsUser": 0},
+            }
+        )
+
+    return _JobSkeleton(
+        volumes=tuple(volumes),
+        volume_mounts=tuple(volume_mounts),
+        mount_env=tuple(mount_env),
         security_context=security_context,
-        node_selector=(request.node_selector if request.node_selector is not None else config.node_selector) or None,
+        init_containers=tuple(init_containers),
     )
 
-    template = V1PodTemplateSpec(
-        metadata=V1ObjectMeta(labels={"app": "sipstuff-operator", "component": "sip-caller"}),
-        spec=pod_spec,
-    )
 
-    job_spec = V1JobSpec(
-        template=template,
-        backoff_limit=config.job_backoff_limit,
-        ttl_seconds_after_finished=config.job_ttl_seconds,
+def _secret_env(name: str, secret_name: str, key: str) -> dict[str, Any]:
+    """Create an env var sourced from a K8s Secret key."""
+    return {"name": name, "valueFrom": {"secretKeyRef": {"name": secret_name, "key": key, "optional": True}}}
+
+
+# (env var / secret key, CallRequest attribute) for every SIP and NAT setting
+# that falls back to the operator's secret when the request leaves it unset
+_SECRET_ENV_FIELDS: tuple[tuple[str, str], ...] = (
+    ("SIP_SERVER", "sip_server"),
+    ("SIP_PORT", "sip_port"),
+    ("SIP_USER", "sip_user"),
+    ("SIP_PASSWORD", "sip_password"),
+    ("SIP_TRANSPORT", "sip_transport"),
+    ("SIP_SRTP", "sip_srtp"),
+    ("SIP_TLS_VERIFY_SERVER", "sip_tls_verify"),
+    ("SIP_STUN_SERVERS", "stun_servers"),
+    ("SIP_ICE_ENABLED", "ice_enabled"),
+    ("SIP_TURN_SERVER", "turn_server"),
+    ("SIP_TURN_USERNAME", "turn_username"),
+    ("SIP_TURN_PASSWORD", "turn_password"),
+    ("SIP_TURN_TRANSPORT", "turn_transport"),
+    ("SIP_KEEPALIVE_SEC", "keepalive_sec"),
+    ("SIP_PUBLIC_ADDRESS", "public_address"),
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _secret_env_vars(secret_name: str) -> tuple[dict[str, Any], ...]:
+    """Secret-backed env vars for every entry of :data:`_SECRET_ENV_FIELDS`, built once per secret.
+
+    The returned dicts are shared by every job built for *secret_name*; the
+    kubernetes serializer only reads them, so they must not be mutated.
+    """
+    return tuple(_secret_env(env_name, secret_name, env_name) for env_name, _ in _SECRET_ENV_FIELDS)
+
+
+_BOOL_ENV_STR: dict[bool, str] = {True: "true", False: "false"}
+
+
+def _env_formatter(annotation: object) -> Callable[[Any], str] | None:
+    """Pick the env-value formatter for an optional ``CallRequest`` field annotation.
+
+    Returns ``None`` for string-valued fields (plain ``str`` or a ``Literal``
+    of strings), whose values are used as-is; a ``"true"``/``"false"`` lookup
+    for bools; and :class:`str` for everything else.
+    """
+    origin = typing.get_origin(annotation)
+    members = typing.get_args(annotation) if origin is types.UnionType or origin is typing.Union else (annotation,)
+    args = [a for a in members if a is not type(None)]
+    if bool in args:
+        return _BOOL_ENV_STR.__getitem__
+    if all(
+        a is str or (typing.get_origin(a) is Literal and all(type(v) is str for v in typing.get_args(a))) for a in args
+    ):
+        return None
+    return str
+
+
+# (index into _SECRET_ENV_FIELDS, env var, CallRequest getter, formatter) per
+# override field; the formatter comes from the model annotation, so the hot
+# path needs no type dispatch and skips ``str()`` on values that already are
+_OVERRIDE_FIELDS: tuple[tuple[int, str, Callable[[CallRequest], Any], Callable[[Any], str] | None], ...] = tuple(
+    (
+        index,
+        env_name,
+        operator.attrgetter(attr_name),
+        _env_formatter(CallRequest.model_fields[attr_name].annotation),
     )
+    for index, (env_name, attr_name) in enumerate(_SECRET_ENV_FIELDS)
+)
+
+
+_UNSET: tuple[object, ...] = (None, "")
+
+# (CLI flag, CallRequest attribute, values for which the flag is omitted,
+# switch without a value token) for ``sipstuff.cli call``, in command-line
+# order.  The numeric skips are the request defaults: the model's lower
+# bounds make ``!= default`` equivalent to ``> 0`` / ``> 1``.
+_CLI_ARG_SPEC: tuple[tuple[str, str, tuple[object, ...], bool], ...] = (
+    ("--text", "text", _UNSET, False),
+    ("--wav", "wav", _UNSET, False),
+    ("--timeout", "timeout", (), False),
+    ("--pre-delay", "pre_delay", (0,), False),
+    ("--inter-delay", "inter_delay", (0,), False),
+    ("--post-delay", "post_delay", (0,), False),
+    ("--wait-for-silence", "wait_for_silence", (None,), False),
+    ("--repeat", "repeat", (1,), False),
+    ("--piper-model", "tts_model", _UNSET, False),
+    ("--tts-sample-rate", "tts_sample_rate", (None,), False),
+    ("--tts-data-dir", "tts_data_dir", _UNSET, False),
+    ("--stt-model", "stt_model", _UNSET, False),
+    ("--stt-language", "stt_language", _UNSET, False),
+    ("--stt-data-dir", "stt_data_dir", _UNSET, False),
+    ("--transcribe", "transcribe", (False,), True),
+    ("--verbose", "verbose", (False,), True),
+    # per-call file path inside the recording volume
+    ("--record", "record", (None,), False),
+)
+
+_CLI_ARGS: tuple[tuple[str, Callable[[CallRequest], Any], tuple[object, ...], bool], ...] = tuple(
+    (flag, operator.attrgetter(attr_name), skip, is_switch) for flag, attr_name, skip, is_switch in _CLI_ARG_SPEC
+)
+
+
+def make_job_builder(config: OperatorConfig) -> Callable[[CallRequest], dict[str, Any]]:
+    """Specialize :func:`build_job` for *config*.
 
-    return V1Job(
-        api_version="batch/v1",
-        kind="Job",
-        metadata=V1ObjectMeta(
-            name=job_name,
-            namespace=config.namespace,
-            labels={"app": "sipstuff-operator", "component": "sip-caller"},
-        ),
-        spec=job_spec,
+    Everything that depends only on the config (secret env vars, skeleton,
+    image, namespace, job limits) is resolved once here; the returned
+    function only does the per-request work.  The API builds one at startup.
+    """
+    secret_env = _secret_env_vars(config.sip_secret_name)
+    skeleton = _job_skeleton(
+        config.piper_data_dir,
+        config.whisper_data_dir,
+        config.recording_dir,
+        config.run_as_user,
+        config.run_as_group,
+        config.fs_group,
     )
+    mount_env = skeleton.mount_env
+    volume_mounts = skeleton.volume_mounts
+    init_containers = skeleton.init_containers
+    volumes = skeleton.volumes
+    security_context = skeleton.security_context
+    image = config.job_image
+    namespace = config.namespace
+    host_network = config.host_network
+    backoff_limit = config.job_backoff_limit
+    ttl_seconds = config.job_ttl_seconds
+    default_node_selector = config.node_selector
+
+    def build(request: CallRequest) -> dict[str, Any]:
+        args: list[str] = ["python3", "-m", "sipstuff.cli", "call", "--dest", request.dest]
+        append = args.append
+        for flag, getter, skip, is_switch in _CLI_ARGS:
+            val = getter(request)
+            if val not in skip:
+                append(flag)
+                if not is_switch:
+                    append(val if type(val) is str else str(val))
+
+        # Environment variables for SIP connection and NAT traversal: start from the
+        # shared secret-backed defaults and swap in a plain value per request override
+        env_vars = list(secret_env)
+        for index, env_name, env_getter, to_str in _OVERRIDE_FIELDS:
+            val = env_getter(request)
+            if val is not None:
+                env_vars[index] = {"name": env_name, "value": val if to_str is None else to_str(val)}
+
+        # When turn_server is provided, implicitly enable TURN
+        if request.turn_server is not None:
+            env_vars.append({"name": "SIP_TURN_ENABLED", "value": "true"})
+        env_vars.extend(mount_env)
+
+        container: dict[str, Any] = {
+            "name": "sip-caller",
+            "image": image,
+            "imagePullPolicy": "Always",
+            "command": args,
+            "env": env_vars,
+        }
+        if volume_mounts:
+            container["volumeMounts"] = list(volume_mounts)
+
+        pod_spec: dict[str, Any] = {
+            "containers": [container],
+            "restartPolicy": "Never",
+            "hostNetwork": host_network,
+        }
+        if init_containers:
+            pod_spec["initContainers"] = list(init_containers)
+        if volumes:
+            pod_spec["volumes"] = list(volumes)
+        if security_context is not None:
+            pod_spec["securityContext"] = security_context
+        node_selector = request.node_selector if request.node_selector is not None else default_node_selector
+        if node_selector:
+            pod_spec["nodeSelector"] = node_selector
+
+        return {
+            "apiVersion": "batch/v1",
+            "kind": "Job",
+            "metadata": {"name": _generate_job_name(), "namespace": namespace, "labels": dict(_JOB_LABELS)},
+            "spec": {
+                "template": {"metadata": {"labels": dict(_JOB_LABELS)}, "spec": pod_spec},
+                "backoffLimit": backoff_limit,
+                "ttlSecondsAfterFinished": ttl_seconds,
+            },
+        }
+
+    return build
+
+
+def build_job(request: CallRequest, config: OperatorConfig) -> dict[str, Any]:
+    """Construct a ``batch/v1`` Job manifest for executing a SIP call.
+
+    When ``piper_data_dir``, ``whisper_data_dir``, or ``recording_dir`` are set
+    on *config*, corresponding ``hostPath`` volumes (``DirectoryOrCreate``) are
+    created and mounted at ``/data/piper``, ``/data/whisper``, and
+    ``/data/recordings`` respectively.  Container env vars point to the mount
+    paths (not the host paths).
+
+    When ``record`` is set on *request*, ``--record <path>`` is passed to the
+    ``sipstuff.cli call`` command (the path should point inside the recording
+    volume, e.g. ``/data/recordings/call.wav``).
+
+    If any of ``run_as_user``, ``run_as_group``, or ``fs_group`` are set on
+    *config*, a ``PodSecurityContext`` is added to the pod spec.
+
+    Config-derived sub-dicts (volumes, mounts, security context, secret env
+    vars) are shared between jobs; callers must treat the manifest as
+    read-only.  For many jobs from one config, use :func:`make_job_builder`.
+    """
+    return make_job_builder(config)(request)
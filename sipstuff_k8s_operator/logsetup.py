@@ -0,0 +1,84 @@
+"""Logging setup shared by the CLI entry point and the uvicorn worker factory.
+
+Both helpers are cached so they run at most once per process, whichever of
+``__main__.main`` or ``operator.create_app_factory`` gets there first.
+"""
+
+import functools
+import logging
+
+from loguru import logger as glogger
+
+from sipstuff_k8s_operator import configure_logging
+
+_uvicorn_logger = glogger.bind(classname="uvicorn")
+
+
+@functools.cache
+def ensure_logging() -> None:
+    """Install the loguru sink and enable package logging (runs once per process).
+
+    Kept out of module import so that importing this module (e.g. from tests
+    or tooling) does not reconfigure loguru as a side effect.
+    """
+    configure_logging()
+    glogger.enable("sipstuff_k8s_operator")
+
+
+# stdlib level name -> loguru level (name, or numeric level if loguru has no such name)
+_LEVEL_CACHE: dict[str, str | int] = {}
+
+
+class _LoguruInterceptHandler(logging.Handler):
+    """Intercept stdlib logging records and route them through loguru.
+
+    Installed as the sole handler on uvicorn's loggers so that all uvicorn
+    output is unified under the loguru sink.  Access logs bypass it: the
+    operator app logs those itself (see ``operator._AccessLogMiddleware``).
+    """
+
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        """Create the handler and pre-build the loguru options for plain records.
+
+        Args:
+            level: Minimum stdlib level handled (default: all).
+        """
+        super().__init__(level)
+        # opt() returns a new logger on every call; without exc_info it never changes
+        self._opt_no_exc = _uvicorn_logger.opt(depth=6)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Forward a stdlib ``LogRecord`` to the loguru logger.
+
+        Args:
+            record: The stdlib log record to forward.
+        """
+        level = _LEVEL_CACHE.get(record.levelname)
+        if level is None:
+            try:
+                level = glogger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            _LEVEL_CACHE[record.levelname] = level
+        if record.exc_info is None:
+            self._opt_no_exc.log(level, "{}", record.getMessage())
+        else:
+            _uvicorn_logger.opt(depth=6, exception=record.exc_info).log(level, "{}", record.getMessage())
+
+
+@functools.cache
+def install_uvicorn_logging() -> None:
+    """Route uvicorn's stdlib loggers into loguru (runs once per process).
+
+    Attaches one shared intercept handler directly to the ``uvicorn`` and
+    ``uvicorn.error`` loggers, so ``uvicorn.run`` can be called with
+    ``log_config=None`` and skip its ``logging.config.dictConfig`` pass.
+    Only the server paths call this (``__main__.main`` and
+    ``operator.create_app_factory``); the CLI subcommands never construct the handler.
+    """
+    handler = _LoguruInterceptHandler()
+    for name in ("uvicorn", "uvicorn.error"):
+        std_logger = logging.getLogger(name)
+        std_logger.handlers = [handler]
+        std_logger.setLevel(logging.INFO)
+        std_logger.propagate = False
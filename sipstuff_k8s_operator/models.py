@@ -1,5 +1,11 @@
-"""Pydantic v2 models for API request/response."""
+"""API request/response types.
 
+The inbound :class:`CallRequest` is a Pydantic v2 model so request bodies are
+validated.  Responses are only ever built server-side from trusted data, so
+they are plain slotted dataclasses; FastAPI still derives their schema.
+"""
+
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Literal
 
@@ -68,7 +74,8 @@ class CallRequest(BaseModel):
         return self
 
 
-class CallResponse(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CallResponse:
     """Response from POST /call."""
 
     job_name: str
@@ -76,7 +83,8 @@ class CallResponse(BaseModel):
     status: str
 
 
-class JobInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class JobInfo:
     """Job status information."""
 
     name: str
@@ -86,7 +94,8 @@ class JobInfo(BaseModel):
     completed_at: datetime | None = None
 
 
-class HealthResponse(BaseModel):
+@dataclass(frozen=True, slots=True)
+class HealthResponse:
     """Response from GET /health."""
 
     status: str
@@ -1,35 +1,125 @@
 """FastAPI application factory for the SIP call job operator."""
 
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
-from kubernetes import client as k8s_client
-from kubernetes import config as k8s_config
+from kubernetes_asyncio import client as k8s_client
+from kubernetes_asyncio import config as k8s_config
 from loguru import logger as glogger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from sipstuff_k8s_operator import __version__
 from sipstuff_k8s_operator.api import router
 from sipstuff_k8s_operator.config import OperatorConfig
+from sipstuff_k8s_operator.informer import JobInformer
+from sipstuff_k8s_operator.job_builder import make_job_builder
+from sipstuff_k8s_operator.logsetup import ensure_logging, install_uvicorn_logging
 
 logger = glogger.bind(classname="operator")
+_access_logger = glogger.bind(classname="uvicorn.access")
 
 
-def _init_k8s() -> None:
+async def _init_k8s() -> None:
     """Load Kubernetes configuration (in-cluster with local fallback)."""
     try:
-        k8s_config.load_incluster_config()
+        k8s_config.load_incluster_config()  # type: ignore[no-untyped-call]
         logger.info("Loaded in-cluster Kubernetes config")
     except k8s_config.ConfigException:
-        k8s_config.load_kube_config()
+        await k8s_config.load_kube_config()
         logger.info("Loaded local kubeconfig")
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Own the asyncio Kubernetes client and job informer for the lifetime of the app.
+
+    The client's aiohttp session must be created inside the running event
+    loop and closed on shutdown, so it is set up here rather than in
+    :func:`create_app`.
+    """
+    await _init_k8s()
+    api_client = k8s_client.ApiClient()
+    batch_api = k8s_client.BatchV1Api(api_client)
+    informer = JobInformer(batch_api, app.state.config.namespace)
+    app.state.batch_api = batch_api
+    app.state.job_informer = informer
+    informer.start()
+    try:
+        yield
+    finally:
+        await informer.stop()
+        await api_client.close()
+
+
+class _AccessLogMiddleware:
+    """Pure ASGI middleware logging one access line per HTTP request straight through loguru.
+
+    Replaces uvicorn's stdlib access logger, which would otherwise build a
+    ``LogRecord`` per request only to have it re-emitted via the loguru
+    intercept handler.  Unlike ``@app.middleware("http")`` it adds no task
+    group or memory streams: it only wraps ``send`` to catch the status code.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            client = scope.get("client")
+            query = scope.get("query_string")
+            _access_logger.info(
+                '{}:{} - "{} {}{} HTTP/{}" {} ({:.2f} ms)',
+                client[0] if client else "-",
+                client[1] if client else "-",
+                scope["method"],
+                scope["path"],
+                "?" + query.decode("latin-1") if query else "",
+                scope.get("http_version", "1.1"),
+                status_code,
+                (time.perf_counter() - start) * 1000.0,
+            )
+
+
 def create_app(config: OperatorConfig) -> FastAPI:
-    """Build and return the FastAPI application."""
-    _init_k8s()
+    """Build and return the FastAPI application.
 
-    app = FastAPI(title="sipstuff-k8s-operator", version=__version__)
+    The Kubernetes config, ``BatchV1Api`` and :class:`JobInformer` are set up
+    on startup by the app's lifespan handler.
+    """
+    app = FastAPI(title="sipstuff-k8s-operator", version=__version__, lifespan=_lifespan)
     app.state.config = config
-    app.state.batch_api = k8s_client.BatchV1Api()
+    app.state.build_job = make_job_builder(config)
 
+    app.add_middleware(_AccessLogMiddleware)
     app.include_router(router)
 
     return app
+
+
+def create_app_factory() -> FastAPI:
+    """Zero-argument app factory for uvicorn's multi-worker mode.
+
+    Each worker process is spawned fresh, so it sets up logging and reads
+    :class:`OperatorConfig` from the environment itself before building the
+    app with :func:`create_app`.
+    """
+    ensure_logging()
+    install_uvicorn_logging()
+    return create_app(OperatorConfig.from_env())
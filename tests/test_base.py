@@ -1,13 +1,26 @@
 """Tests for sipstuff_k8s_operator."""
 
+import asyncio
 import os
-from unittest.mock import patch
+from dataclasses import replace
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Iterator
+from unittest.mock import AsyncMock, patch
 
+import orjson
 import pytest
+from fastapi import HTTPException
+from kubernetes_asyncio.client.exceptions import ApiException
+from loguru import logger
 
 import sipstuff_k8s_operator
+from sipstuff_k8s_operator.api import create_call, get_job
 from sipstuff_k8s_operator.config import OperatorConfig, parse_node_selector
+from sipstuff_k8s_operator.informer import JobInformer, job_info_from_json
+from sipstuff_k8s_operator.job_builder import _generate_job_name, build_job, make_job_builder
 from sipstuff_k8s_operator.models import CallRequest, CallResponse, HealthResponse, JobInfo
+from sipstuff_k8s_operator.operator import _AccessLogMiddleware
 
 # ---------------------------------------------------------------------------
 # Version
@@ -35,6 +48,24 @@ def test_version_format() -> None:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _clear_config_cache() -> Iterator[None]:
+    """Drop the cached ``OperatorConfig.from_env()`` result around every test."""
+    OperatorConfig.from_env.cache_clear()
+    yield
+    OperatorConfig.from_env.cache_clear()
+
+
+def test_config_from_env_cached() -> None:
+    """from_env returns the same instance until the cache is cleared."""
+    with patch.dict(os.environ, {"PORT": "9091"}, clear=True):
+        cfg = OperatorConfig.from_env()
+    with patch.dict(os.environ, {"PORT": "9092"}, clear=True):
+        assert OperatorConfig.from_env() is cfg
+        OperatorConfig.from_env.cache_clear()
+        assert OperatorConfig.from_env().port == 9092
+
+
 def test_config_defaults() -> None:
     """Config loads with all defaults when no env vars are set."""
     with patch.dict(os.environ, {}, clear=True):
@@ -47,6 +78,7 @@ def test_config_defaults() -> None:
     assert cfg.host_network is True
     assert cfg.port == 8080
     assert cfg.node_selector is None
+    assert cfg.workers == 1
 
 
 def test_parse_node_selector() -> None:
@@ -67,6 +99,13 @@ def test_config_node_selector_from_env() -> None:
     assert cfg.node_selector == {"mayplacecalls": "true", "zone": "eu-west"}
 
 
+def test_config_empty_web_concurrency() -> None:
+    """An empty WEB_CONCURRENCY counts as unset rather than failing int()."""
+    with patch.dict(os.environ, {"WEB_CONCURRENCY": ""}, clear=True):
+        cfg = OperatorConfig.from_env()
+    assert cfg.workers == 1
+
+
 def test_config_from_env() -> None:
     """Config picks up custom env vars."""
     env = {
@@ -77,6 +116,7 @@ def test_config_from_env() -> None:
         "JOB_BACKOFF_LIMIT": "3",
         "JOB_HOST_NETWORK": "false",
         "PORT": "9090",
+        "WEB_CONCURRENCY": "4",
     }
     with patch.dict(os.environ, env, clear=True):
         cfg = OperatorConfig.from_env()
@@ -87,6 +127,7 @@ def test_config_from_env() -> None:
     assert cfg.job_backoff_limit == 3
     assert cfg.host_network is False
     assert cfg.port == 9090
+    assert cfg.workers == 4
 
 
 # ---------------------------------------------------------------------------
@@ -213,17 +254,16 @@ def test_job_info() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_job_builder_text() -> None:
-    """Job builder produces a valid V1Job for a text-based call."""
-    from sipstuff_k8s_operator.job_builder import build_job
-
-    cfg = OperatorConfig(
-        namespace="test-ns",
-        job_image="myimage:latest",
-        sip_secret_name="my-secret",
-        job_ttl_seconds=1800,
-        job_backoff_limit=1,
-        host_network=True,
+@pytest.fixture(scope="module")
+def job_config() -> OperatorConfig:
+    """Minimal operator config (no volumes, security context or node selector) shared by job builder tests."""
+    return OperatorConfig(
+        namespace="ns",
+        job_image="img:latest",
+        sip_secret_name="secret",
+        job_ttl_seconds=3600,
+        job_backoff_limit=0,
+        host_network=False,
         port=8080,
         piper_data_dir=None,
         whisper_data_dir=None,
@@ -233,36 +273,44 @@ def test_job_builder_text() -> None:
         fs_group=None,
         node_selector=None,
     )
-    req = CallRequest(dest="+4912345", text="Hello")
-    job = build_job(req, cfg)
 
-    assert job.metadata.name.startswith("sipcall-")
-    assert job.metadata.namespace == "test-ns"
-    assert job.metadata.labels["app"] == "sipstuff-operator"
-    assert job.spec.backoff_limit == 1
-    assert job.spec.ttl_seconds_after_finished == 1800
 
-    container = job.spec.template.spec.containers[0]
-    assert container.image == "myimage:latest"
-    assert "--dest" in container.command
-    assert "+4912345" in container.command
-    assert "--text" in container.command
-    assert "Hello" in container.command
-    assert job.spec.template.spec.host_network is True
-    assert job.spec.template.spec.restart_policy == "Never"
+def test_generate_job_name_format() -> None:
+    """Job names are ``sipcall-YYYYMMDD-HHMM-xxxx`` with a 4-char hex suffix (valid DNS-1123 label)."""
+    import re
 
+    names = {_generate_job_name() for _ in range(20)}
+    for name in names:
+        assert re.fullmatch(r"sipcall-\d{8}-\d{4}-[0-9a-f]{4}", name), name
+    assert len(names) > 1
 
-def test_job_builder_sip_override() -> None:
-    """When SIP params are provided in the request, they become plain env vars."""
-    from sipstuff_k8s_operator.job_builder import build_job
 
+def test_generate_job_name_prefix_rolls_over() -> None:
+    """The cached minute prefix is reused within a UTC minute and refreshed at the boundary."""
+    from sipstuff_k8s_operator import job_builder
+
+    base = 1770561000.0  # 2026-02-08 14:30:00 UTC
+    with patch.object(job_builder, "_job_name_prefix", ("", 0.0)), patch("time.time", return_value=base):
+        first = job_builder._generate_job_name()
+        with patch("time.time", return_value=base + 59.9):
+            same_minute = job_builder._generate_job_name()
+        with patch("time.time", return_value=base + 60):
+            next_minute = job_builder._generate_job_name()
+
+    assert first.startswith("sipcall-20260208-1430-")
+    assert same_minute.startswith("sipcall-20260208-1430-")
+    assert next_minute.startswith("sipcall-20260208-1431-")
+
+
+def test_job_builder_text() -> None:
+    """Job builder produces a valid batch/v1 Job manifest for a text-based call."""
     cfg = OperatorConfig(
-        namespace="ns",
-        job_image="img:latest",
-        sip_secret_name="secret",
-        job_ttl_seconds=3600,
-        job_backoff_limit=0,
-        host_network=False,
+        namespace="test-ns",
+        job_image="myimage:latest",
+        sip_secret_name="my-secret",
+        job_ttl_seconds=1800,
+        job_backoff_limit=1,
+        host_network=True,
         port=8080,
         piper_data_dir=None,
         whisper_data_dir=None,
@@ -272,45 +320,51 @@ def test_job_builder_sip_override() -> None:
         fs_group=None,
         node_selector=None,
     )
-    req = CallRequest(dest="+49123", text="test", sip_server="sip.example.com", sip_port=5061)
+    req = CallRequest(dest="+4912345", text="Hello")
     job = build_job(req, cfg)
 
-    container = job.spec.template.spec.containers[0]
-    env_dict = {e.name: e for e in container.env}
+    assert job["apiVersion"] == "batch/v1"
+    assert job["kind"] == "Job"
+    assert job["metadata"]["name"].startswith("sipcall-")
+    assert job["metadata"]["namespace"] == "test-ns"
+    assert job["metadata"]["labels"]["app"] == "sipstuff-operator"
+    assert job["spec"]["backoffLimit"] == 1
+    assert job["spec"]["ttlSecondsAfterFinished"] == 1800
+
+    container = job["spec"]["template"]["spec"]["containers"][0]
+    assert container["image"] == "myimage:latest"
+    assert "--dest" in container["command"]
+    assert "+4912345" in container["command"]
+    assert "--text" in container["command"]
+    assert "Hello" in container["command"]
+    assert "volumeMounts" not in container
+    assert job["spec"]["template"]["spec"]["hostNetwork"] is True
+    assert job["spec"]["template"]["spec"]["restartPolicy"] == "Never"
+
+
+def test_job_builder_sip_override(job_config: OperatorConfig) -> None:
+    """When SIP params are provided in the request, they become plain env vars."""
+    req = CallRequest(dest="+49123", text="test", sip_server="sip.example.com", sip_port=5061)
+    job = build_job(req, job_config)
+
+    container = job["spec"]["template"]["spec"]["containers"][0]
+    env_dict = {e["name"]: e for e in container["env"]}
 
     # Overridden fields should be plain values
-    assert env_dict["SIP_SERVER"].value == "sip.example.com"
-    assert env_dict["SIP_PORT"].value == "5061"
+    assert env_dict["SIP_SERVER"]["value"] == "sip.example.com"
+    assert env_dict["SIP_PORT"]["value"] == "5061"
 
     # Non-overridden fields should reference the secret
-    assert env_dict["SIP_USER"].value_from is not None
-    assert env_dict["SIP_USER"].value_from.secret_key_ref.name == "secret"
+    assert "valueFrom" in env_dict["SIP_USER"]
+    assert env_dict["SIP_USER"]["valueFrom"]["secretKeyRef"]["name"] == "secret"
 
 
-def test_job_builder_wav() -> None:
+def test_job_builder_wav(job_config: OperatorConfig) -> None:
     """Job builder produces correct args for wav-based calls."""
-    from sipstuff_k8s_operator.job_builder import build_job
-
-    cfg = OperatorConfig(
-        namespace="ns",
-        job_image="img:latest",
-        sip_secret_name="secret",
-        job_ttl_seconds=3600,
-        job_backoff_limit=0,
-        host_network=False,
-        port=8080,
-        piper_data_dir=None,
-        whisper_data_dir=None,
-        recording_dir=None,
-        run_as_user=None,
-        run_as_group=None,
-        fs_group=None,
-        node_selector=None,
-    )
     req = CallRequest(dest="+49123", wav="/audio/greeting.wav", verbose=True, repeat=3, pre_delay=2.0)
-    job = build_job(req, cfg)
+    job = build_job(req, job_config)
 
-    cmd = job.spec.template.spec.containers[0].command
+    cmd = job["spec"]["template"]["spec"]["containers"][0]["command"]
     assert "--wav" in cmd
     assert "/audio/greeting.wav" in cmd
     assert "--verbose" in cmd
@@ -320,94 +374,76 @@ def test_job_builder_wav() -> None:
     assert "--text" not in cmd
 
 
-def test_job_builder_inter_delay() -> None:
+def test_job_builder_inter_delay(job_config: OperatorConfig) -> None:
     """Job builder adds --inter-delay when inter_delay > 0."""
-    from sipstuff_k8s_operator.job_builder import build_job
-
-    cfg = OperatorConfig(
-        namespace="ns",
-        job_image="img:latest",
-        sip_secret_name="secret",
-        job_ttl_seconds=3600,
-        job_backoff_limit=0,
-        host_network=False,
-        port=8080,
-        piper_data_dir=None,
-        whisper_data_dir=None,
-        recording_dir=None,
-        run_as_user=None,
-        run_as_group=None,
-        fs_group=None,
-        node_selector=None,
-    )
     req = CallRequest(dest="+49123", text="test", inter_delay=2.5)
-    job = build_job(req, cfg)
+    job = build_job(req, job_config)
 
-    cmd = job.spec.template.spec.containers[0].command
+    cmd = job["spec"]["template"]["spec"]["containers"][0]["command"]
     assert "--inter-delay" in cmd
     assert "2.5" in cmd
 
     # When 0, flag should not appear
     req_zero = CallRequest(dest="+49123", text="test", inter_delay=0.0)
-    job_zero = build_job(req_zero, cfg)
-    cmd_zero = job_zero.spec.template.spec.containers[0].command
+    job_zero = build_job(req_zero, job_config)
+    cmd_zero = job_zero["spec"]["template"]["spec"]["containers"][0]["command"]
     assert "--inter-delay" not in cmd_zero
 
 
-def test_job_builder_tls_verify() -> None:
-    """Job builder sets SIP_TLS_VERIFY_SERVER env var from sip_tls_verify."""
-    from sipstuff_k8s_operator.job_builder import build_job
-
-    cfg = OperatorConfig(
-        namespace="ns",
-        job_image="img:latest",
-        sip_secret_name="secret",
-        job_ttl_seconds=3600,
-        job_backoff_limit=0,
-        host_network=False,
-        port=8080,
-        piper_data_dir=None,
-        whisper_data_dir=None,
-        recording_dir=None,
-        run_as_user=None,
-        run_as_group=None,
-        fs_group=None,
-        node_selector=None,
+def test_job_builder_args_order(job_config: OperatorConfig) -> None:
+    """Job builder emits set options in CLI order, skipping defaults and unset values."""
+    req = CallRequest(
+        dest="+49123",
+        text="hello",
+        wait_for_silence=0.0,
+        tts_sample_rate=16000,
+        stt_language="de",
+        transcribe=True,
+        record="/data/recordings/call.wav",
     )
+    job = build_job(req, job_config)
+
+    assert job["spec"]["template"]["spec"]["containers"][0]["command"] == [
+        "python3",
+        "-m",
+        "sipstuff.cli",
+        "call",
+        "--dest",
+        "+49123",
+        "--text",
+        "hello",
+        "--timeout",
+        "60",
+        "--wait-for-silence",
+        "0.0",
+        "--tts-sample-rate",
+        "16000",
+        "--stt-language",
+        "de",
+        "--transcribe",
+        "--record",
+        "/data/recordings/call.wav",
+    ]
+
+
+def test_job_builder_tls_verify(job_config: OperatorConfig) -> None:
+    """Job builder sets SIP_TLS_VERIFY_SERVER env var from sip_tls_verify."""
     req = CallRequest(dest="+49123", text="test", sip_tls_verify=False)
-    job = build_job(req, cfg)
+    job = build_job(req, job_config)
 
-    env_dict = {e.name: e for e in job.spec.template.spec.containers[0].env}
-    assert env_dict["SIP_TLS_VERIFY_SERVER"].value == "false"
+    env_dict = {e["name"]: e for e in job["spec"]["template"]["spec"]["containers"][0]["env"]}
+    assert env_dict["SIP_TLS_VERIFY_SERVER"]["value"] == "false"
 
     # When not provided, should fall back to secret
     req_none = CallRequest(dest="+49123", text="test")
-    job_none = build_job(req_none, cfg)
-    env_dict_none = {e.name: e for e in job_none.spec.template.spec.containers[0].env}
-    assert env_dict_none["SIP_TLS_VERIFY_SERVER"].value_from is not None
-    assert env_dict_none["SIP_TLS_VERIFY_SERVER"].value_from.secret_key_ref.name == "secret"
+    job_none = build_job(req_none, job_config)
+    env_dict_none = {e["name"]: e for e in job_none["spec"]["template"]["spec"]["containers"][0]["env"]}
+    assert "valueFrom" in env_dict_none["SIP_TLS_VERIFY_SERVER"]
+    assert env_dict_none["SIP_TLS_VERIFY_SERVER"]["valueFrom"]["secretKeyRef"]["name"] == "secret"
 
 
-def test_job_builder_nat_fields() -> None:
+def test_job_builder_nat_fields(job_config: OperatorConfig) -> None:
     """Job builder sets NAT env vars correctly from request fields."""
-    from sipstuff_k8s_operator.job_builder import build_job
-
-    cfg = OperatorConfig(
-        namespace="ns",
-        job_image="img:latest",
-        sip_secret_name="secret",
-        job_ttl_seconds=3600,
-        job_backoff_limit=0,
-        host_network=False,
-        port=8080,
-        piper_data_dir=None,
-        whisper_data_dir=None,
-        recording_dir=None,
-        run_as_user=None,
-        run_as_group=None,
-        fs_group=None,
-        node_selector=None,
-    )
     req = CallRequest(
         dest="+49123",
         text="test",
@@ -420,129 +456,457 @@ def test_job_builder_nat_fields() -> None:
         keepalive_sec=15,
         public_address="203.0.113.5",
     )
-    job = build_job(req, cfg)
-
-    env_dict = {e.name: e for e in job.spec.template.spec.containers[0].env}
-    assert env_dict["SIP_STUN_SERVERS"].value == "stun.l.google.com:19302"
-    assert env_dict["SIP_ICE_ENABLED"].value == "true"
-    assert env_dict["SIP_TURN_SERVER"].value == "turn.example.com:3478"
-    assert env_dict["SIP_TURN_USERNAME"].value == "user"
-    assert env_dict["SIP_TURN_PASSWORD"].value == "pass"
-    assert env_dict["SIP_TURN_TRANSPORT"].value == "tcp"
-    assert env_dict["SIP_KEEPALIVE_SEC"].value == "15"
-    assert env_dict["SIP_PUBLIC_ADDRESS"].value == "203.0.113.5"
+    job = build_job(req, job_config)
+
+    env_dict = {e["name"]: e for e in job["spec"]["template"]["spec"]["containers"][0]["env"]}
+    assert env_dict["SIP_STUN_SERVERS"]["value"] == "stun.l.google.com:19302"
+    assert env_dict["SIP_ICE_ENABLED"]["value"] == "true"
+    assert env_dict["SIP_TURN_SERVER"]["value"] == "turn.example.com:3478"
+    assert env_dict["SIP_TURN_USERNAME"]["value"] == "user"
+    assert env_dict["SIP_TURN_PASSWORD"]["value"] == "pass"
+    assert env_dict["SIP_TURN_TRANSPORT"]["value"] == "tcp"
+    assert env_dict["SIP_KEEPALIVE_SEC"]["value"] == "15"
+    assert env_dict["SIP_PUBLIC_ADDRESS"]["value"] == "203.0.113.5"
     # turn_server provided → SIP_TURN_ENABLED=true
-    assert env_dict["SIP_TURN_ENABLED"].value == "true"
+    assert env_dict["SIP_TURN_ENABLED"]["value"] == "true"
 
     # When NAT fields are not provided, they should fall back to secret
     req_none = CallRequest(dest="+49123", text="test")
-    job_none = build_job(req_none, cfg)
-    env_dict_none = {e.name: e for e in job_none.spec.template.spec.containers[0].env}
-    assert env_dict_none["SIP_STUN_SERVERS"].value_from is not None
-    assert env_dict_none["SIP_STUN_SERVERS"].value_from.secret_key_ref.name == "secret"
+    job_none = build_job(req_none, job_config)
+    env_dict_none = {e["name"]: e for e in job_none["spec"]["template"]["spec"]["containers"][0]["env"]}
+    assert "valueFrom" in env_dict_none["SIP_STUN_SERVERS"]
+    assert env_dict_none["SIP_STUN_SERVERS"]["valueFrom"]["secretKeyRef"]["name"] == "secret"
     # SIP_TURN_ENABLED should NOT be present when turn_server is not provided
     assert "SIP_TURN_ENABLED" not in env_dict_none
 
 
-def test_job_builder_no_node_selector() -> None:
-    """Job without node_selector (neither config nor request) has None in pod spec."""
-    from sipstuff_k8s_operator.job_builder import build_job
-
-    cfg = OperatorConfig(
-        namespace="ns",
-        job_image="img:latest",
-        sip_secret_name="secret",
-        job_ttl_seconds=3600,
-        job_backoff_limit=0,
-        host_network=False,
-        port=8080,
-        piper_data_dir=None,
-        whisper_data_dir=None,
-        recording_dir=None,
-        run_as_user=None,
-        run_as_group=None,
-        fs_group=None,
-        node_selector=None,
-    )
+def test_job_builder_no_node_selector(job_config: OperatorConfig) -> None:
+    """Job without node_selector (neither config nor request) omits nodeSelector from the pod spec."""
     req = CallRequest(dest="+49123", text="test")
-    job = build_job(req, cfg)
+    job = build_job(req, job_config)
 
-    assert job.spec.template.spec.node_selector is None
+    assert "nodeSelector" not in job["spec"]["template"]["spec"]
 
 
-def test_job_builder_request_node_selector_overrides() -> None:
+def test_job_builder_request_node_selector_overrides(job_config: OperatorConfig) -> None:
     """Request node_selector overrides config default."""
-    from sipstuff_k8s_operator.job_builder import build_job
-
-    cfg = OperatorConfig(
-        namespace="ns",
-        job_image="img:latest",
-        sip_secret_name="secret",
-        job_ttl_seconds=3600,
-        job_backoff_limit=0,
-        host_network=False,
-        port=8080,
-        piper_data_dir=None,
-        whisper_data_dir=None,
-        recording_dir=None,
-        run_as_user=None,
-        run_as_group=None,
-        fs_group=None,
-        node_selector={"default-key": "default-val"},
-    )
+    cfg = replace(job_config, node_selector={"default-key": "default-val"})
     req = CallRequest(dest="+49123", text="test", node_selector={"mayplacecalls": "true"})
     job = build_job(req, cfg)
 
-    assert job.spec.template.spec.node_selector == {"mayplacecalls": "true"}
+    assert job["spec"]["template"]["spec"]["nodeSelector"] == {"mayplacecalls": "true"}
 
 
-def test_job_builder_config_node_selector_default() -> None:
+def test_job_builder_config_node_selector_default(job_config: OperatorConfig) -> None:
     """Config node_selector is used when request does not set one."""
-    from sipstuff_k8s_operator.job_builder import build_job
+    cfg = replace(job_config, node_selector={"mayplacecalls": "true"})
+    req = CallRequest(dest="+49123", text="test")
+    job = build_job(req, cfg)
 
-    cfg = OperatorConfig(
-        namespace="ns",
-        job_image="img:latest",
-        sip_secret_name="secret",
-        job_ttl_seconds=3600,
-        job_backoff_limit=0,
-        host_network=False,
-        port=8080,
-        piper_data_dir=None,
-        whisper_data_dir=None,
-        recording_dir=None,
-        run_as_user=None,
-        run_as_group=None,
-        fs_group=None,
-        node_selector={"mayplacecalls": "true"},
+    assert job["spec"]["template"]["spec"]["nodeSelector"] == {"mayplacecalls": "true"}
+
+
+def test_job_builder_request_nulls_config_node_selector(job_config: OperatorConfig) -> None:
+    """Request with empty dict node_selector explicitly clears config default."""
+    cfg = replace(job_config, node_selector={"mayplacecalls": "true"})
+    req = CallRequest(dest="+49123", text="test", node_selector={})
+    job = build_job(req, cfg)
+
+    assert "nodeSelector" not in job["spec"]["template"]["spec"]
+
+
+def test_job_builder_volumes_and_init_container(job_config: OperatorConfig) -> None:
+    """Host dirs become volumes/mounts/env vars; run_as_user adds the chown initContainer, reused per config."""
+    cfg = replace(
+        job_config, piper_data_dir="/host/piper", recording_dir="/host/rec", run_as_user=1200, run_as_group=1201
     )
     req = CallRequest(dest="+49123", text="test")
     job = build_job(req, cfg)
+    pod = job["spec"]["template"]["spec"]
 
-    assert job.spec.template.spec.node_selector == {"mayplacecalls": "true"}
+    assert [v["hostPath"]["path"] for v in pod["volumes"]] == ["/host/piper", "/host/rec"]
+    assert [m["mountPath"] for m in pod["containers"][0]["volumeMounts"]] == ["/data/piper", "/data/recordings"]
+    env_dict = {e["name"]: e for e in pod["containers"][0]["env"]}
+    assert env_dict["PIPER_DATA_DIR"]["value"] == "/data/piper"
+    assert env_dict["RECORDING_DIR"]["value"] == "/data/recordings"
+    assert "WHISPER_DATA_DIR" not in env_dict
+    assert pod["securityContext"] == {"runAsUser": 1200, "runAsGroup": 1201}
+    assert pod["initContainers"][0]["command"] == ["sh", "-c", "chown -R 1200:1201 /data/piper /data/recordings"]
 
+    # Config-derived parts are built once and shared; per-job lists are fresh
+    job2 = build_job(req, cfg)
+    assert job2["spec"]["template"]["spec"]["volumes"][0] is pod["volumes"][0]
+    assert job2["spec"]["template"]["spec"]["volumes"] is not pod["volumes"]
 
-def test_job_builder_request_nulls_config_node_selector() -> None:
-    """Request with empty dict node_selector explicitly clears config default."""
-    from sipstuff_k8s_operator.job_builder import build_job
 
-    cfg = OperatorConfig(
+def test_job_builder_secret_env_shared_across_jobs() -> None:
+    """Secret-backed env vars are shared between jobs; an override only replaces its own entry."""
+    with patch.dict(os.environ, {}, clear=True):
+        cfg = OperatorConfig.from_env()
+
+    def env_of(req: CallRequest) -> list[dict[str, Any]]:
+        return build_job(req, cfg)["spec"]["template"]["spec"]["containers"][0]["env"]  # type: ignore[no-any-return]
+
+    plain = env_of(CallRequest(dest="+49123", text="test"))
+    override = env_of(CallRequest(dest="+49123", text="test", sip_user="alice"))
+    again = env_of(CallRequest(dest="+49123", text="test"))
+
+    assert [e["name"] for e in override] == [e["name"] for e in plain]
+    assert override[2] == {"name": "SIP_USER", "value": "alice"}
+    assert override[0] is plain[0]
+    assert again[2] is plain[2]
+    assert again[2]["valueFrom"]["secretKeyRef"]["name"] == "sip-credentials"
+
+
+# ---------------------------------------------------------------------------
+# Informer
+# ---------------------------------------------------------------------------
+
+
+def test_job_informer_apply_events() -> None:
+    """JobInformer keeps its name -> JobInfo map in step with watch events."""
+
+    def k8s_job(name: str, **status: int) -> SimpleNamespace:
+        return SimpleNamespace(
+            metadata=SimpleNamespace(name=name, namespace="ns", creation_timestamp=None),
+            status=SimpleNamespace(**{"succeeded": None, "failed": None, "active": None, **status}),
+        )
+
+    informer = JobInformer(batch_api=None, namespace="ns")  # type: ignore[arg-type]
+    assert informer.synced is False
+
+    informer.upsert(k8s_job("a"))
+    assert informer.jobs["a"].status == "pending"
+    informer.apply("ADDED", k8s_job("b", active=1))
+    informer.apply("MODIFIED", k8s_job("a", succeeded=1))
+    assert {n: i.status for n, i in informer.jobs.items()} == {"a": "succeeded", "b": "running"}
+    informer.apply("DELETED", k8s_job("a"))
+    informer.apply("DELETED", k8s_job("gone"))
+    informer.apply("BOOKMARK", k8s_job("c"))
+    assert list(informer.jobs) == ["b"]
+    informer.upsert(SimpleNamespace(metadata=k8s_job("d").metadata, status=None))
+    assert informer.jobs["d"].status == "unknown"
+
+
+def test_job_info_from_json() -> None:
+    """job_info_from_json reads raw camelCase API JSON like job_info reads a V1Job."""
+    info = job_info_from_json(
+        {
+            "metadata": {"name": "a", "namespace": "ns", "creationTimestamp": "2026-02-08T14:30:00Z"},
+            "status": {"succeeded": 1, "completionTime": "2026-02-08T14:31:00Z"},
+        }
+    )
+    assert info == JobInfo(
+        name="a",
         namespace="ns",
-        job_image="img:latest",
-        sip_secret_name="secret",
-        job_ttl_seconds=3600,
-        job_backoff_limit=0,
-        host_network=False,
-        port=8080,
-        piper_data_dir=None,
-        whisper_data_dir=None,
-        recording_dir=None,
-        run_as_user=None,
-        run_as_group=None,
-        fs_group=None,
-        node_selector={"mayplacecalls": "true"},
+        status="succeeded",
+        created_at=datetime(2026, 2, 8, 14, 30, tzinfo=timezone.utc),
+        completed_at=datetime(2026, 2, 8, 14, 31, tzinfo=timezone.utc),
     )
-    req = CallRequest(dest="+49123", text="test", node_selector={})
-    job = build_job(req, cfg)
+    assert job_info_from_json({"metadata": {"name": "b", "namespace": "ns"}, "status": {}}).status == "pending"
+    assert job_info_from_json({"metadata": {"name": "c", "namespace": "ns"}}).status == "unknown"
+
+
+@pytest.mark.asyncio
+async def test_job_informer_relist_keeps_jobs_put_in_flight() -> None:
+    """A relist replaces stale entries but keeps jobs put() while the list call was pending."""
+    informer = JobInformer(batch_api=None, namespace="ns")  # type: ignore[arg-type]
+    informer.put(JobInfo(name="stale", namespace="ns", status="running"))
+
+    async def list_namespaced_job(namespace: str, label_selector: str) -> SimpleNamespace:
+        informer.put(JobInfo(name="created", namespace="ns", status="pending"))
+        informer.put(JobInfo(name="listed", namespace="ns", status="pending"))
+        listed = SimpleNamespace(
+            metadata=SimpleNamespace(name="listed", namespace="ns", creation_timestamp=None),
+            status=SimpleNamespace(succeeded=None, failed=None, active=1),
+        )
+        return SimpleNamespace(items=[listed], metadata=SimpleNamespace(resource_version="10"))
+
+    informer.batch_api = SimpleNamespace(list_namespaced_job=list_namespaced_job)  # type: ignore[assignment]
+    assert await informer._relist() == "10"
+    assert {n: i.status for n, i in informer.jobs.items()} == {"listed": "running", "created": "pending"}
+    assert informer.synced is True
+
+    informer.put(JobInfo(name="later", namespace="ns", status="pending"))
+    assert informer._put_during_relist is None
+
+
+@pytest.mark.asyncio
+async def test_job_informer_watch_tracks_resource_version() -> None:
+    """_watch applies events and returns the resourceVersion of the last one, bookmarks included."""
+    events = [
+        {
+            "type": "ADDED",
+            "object": SimpleNamespace(
+                metadata=SimpleNamespace(name="a", namespace="ns", creation_timestamp=None), status=None
+            ),
+            "raw_object": {"metadata": {"name": "a", "resourceVersion": "11"}},
+        },
+        {"type": "BOOKMARK", "object": {}, "raw_object": {"metadata": {"resourceVersion": "12"}}},
+    ]
+
+    class FakeWatch:
+        def stream(self, func: Any, **kwargs: Any) -> "FakeWatch":
+            assert kwargs["resource_version"] == "10"
+            return self
+
+        async def __aenter__(self) -> "FakeWatch":
+            return self
+
+        async def __aexit__(self, *exc: object) -> None:
+            pass
+
+        async def __aiter__(self) -> Any:
+            for event in events:
+                yield event
+
+    informer = JobInformer(batch_api=SimpleNamespace(list_namespaced_job=None), namespace="ns")  # type: ignore[arg-type]
+    with patch("sipstuff_k8s_operator.informer.watch.Watch", FakeWatch):
+        assert await informer._watch("10") == "12"
+        events.clear()
+        assert await informer._watch("10") == "10"
+    assert list(informer.jobs) == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_job_informer_run_resumes_watch() -> None:
+    """A cleanly ended watch resumes from its last resourceVersion; only errors relist and unsync."""
+    informer = JobInformer(batch_api=None, namespace="ns")  # type: ignore[arg-type]
+    relist = AsyncMock(side_effect=["1", "20"])
+    watch = AsyncMock(side_effect=["5", "7", RuntimeError("boom"), asyncio.CancelledError()])
+    unsynced_at_sleep: list[bool] = []
+
+    async def sleep(delay: float) -> None:
+        unsynced_at_sleep.append(informer.synced is False)
+
+    informer.synced = True
+    with (
+        patch.object(informer, "_relist", relist),
+        patch.object(informer, "_watch", watch),
+        patch("sipstuff_k8s_operator.informer.asyncio.sleep", sleep),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await informer._run()
+
+    assert relist.await_count == 2
+    assert [c.args[0] for c in watch.await_args_list] == ["1", "5", "7", "20"]
+    assert unsynced_at_sleep == [True]
+
+
+# ---------------------------------------------------------------------------
+# API
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def api_request() -> SimpleNamespace:
+    """Stand-in for the FastAPI ``Request`` the handlers read ``app.state`` from.
+
+    ``batch_api`` starts empty; tests attach the client methods they exercise.
+    """
+    with patch.dict(os.environ, {}, clear=True):
+        config = OperatorConfig.from_env()
+    state = SimpleNamespace(
+        config=config,
+        build_job=make_job_builder(config),
+        batch_api=SimpleNamespace(),
+        job_informer=JobInformer(batch_api=None, namespace="ns"),  # type: ignore[arg-type]
+    )
+    return SimpleNamespace(app=SimpleNamespace(state=state))
+
+
+@pytest.mark.asyncio
+async def test_create_call_records_created_job(api_request: SimpleNamespace) -> None:
+    """create_call reads the raw create response into the informer and maps error statuses to ApiException."""
+    status = 201
+    submitted: list[dict[str, Any]] = []
+
+    async def create_namespaced_job(namespace: str, body: dict[str, Any], _preload_content: bool) -> SimpleNamespace:
+        assert _preload_content is False
+        submitted.append(body)
+        created = {**body, "metadata": {**body["metadata"], "creationTimestamp": "2026-02-08T14:30:00Z"}}
+
+        async def read() -> bytes:
+            return b'{"message": "boom"}' if status >= 300 else orjson.dumps({**created, "status": {}})
+
+        return SimpleNamespace(status=status, reason="", headers={}, read=read)
+
+    state = api_request.app.state
+    state.batch_api.create_namespaced_job = create_namespaced_job
+
+    resp = await create_call(CallRequest(dest="+49123", text="hi"), api_request)  # type: ignore[arg-type]
+    job_name = submitted[0]["metadata"]["name"]
+    assert resp.status_code == 201
+    assert orjson.loads(resp.body) == {"job_name": job_name, "namespace": state.config.namespace, "status": "created"}
+    assert state.job_informer.jobs[job_name].status == "pending"
+    assert state.job_informer.jobs[job_name].created_at is not None
+
+    status = 422
+    with pytest.raises(ApiException) as exc_info:
+        await create_call(CallRequest(dest="+49123", text="hi"), api_request)  # type: ignore[arg-type]
+    assert exc_info.value.status == 422
+
+
+@pytest.mark.asyncio
+async def test_get_job_not_found_maps_api_status(api_request: SimpleNamespace) -> None:
+    """get_job turns a 404 ApiException into an HTTP 404 and re-raises other API errors."""
+
+    async def read_namespaced_job(name: str, namespace: str) -> None:
+        raise ApiException(status=404 if name == "missing" else 500)
+
+    api_request.app.state.batch_api.read_namespaced_job = read_namespaced_job
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_job("missing", api_request)  # type: ignore[arg-type]
+    assert exc_info.value.status_code == 404
+    with pytest.raises(ApiException) as api_exc_info:
+        await get_job("broken", api_request)  # type: ignore[arg-type]
+    assert api_exc_info.value.status == 500
+
+
+@pytest.mark.asyncio
+async def test_get_job_reads_api_unless_informer_synced(api_request: SimpleNamespace) -> None:
+    """get_job answers from the informer only while it is synced; a stale mirror goes to the API."""
+    read: list[str] = []
+
+    async def read_namespaced_job(name: str, namespace: str) -> SimpleNamespace:
+        read.append(name)
+        return SimpleNamespace(
+            metadata=SimpleNamespace(name=name, namespace=namespace, creation_timestamp=None),
+            status=SimpleNamespace(succeeded=1, failed=None, active=None, completion_time=None),
+        )
+
+    state = api_request.app.state
+    state.batch_api.read_namespaced_job = read_namespaced_job
+    state.job_informer.put(JobInfo(name="a", namespace="ns", status="running"))
+
+    state.job_informer.synced = False
+    assert (await get_job("a", api_request)).status == "succeeded"  # type: ignore[arg-type]
+    assert read == ["a"]
+
+    state.job_informer.synced = True
+    assert (await get_job("a", api_request)).status == "running"  # type: ignore[arg-type]
+    assert read == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_access_log_middleware_logs_status() -> None:
+    """The access log middleware passes messages through and logs the response status once."""
+
+    async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+        await send({"type": "http.response.start", "status": 418, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent: list[dict[str, Any]] = []
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    lines: list[str] = []
+    sink_id = logger.add(
+        lines.append, format="{message}", filter=lambda r: r["extra"].get("classname") == "uvicorn.access"
+    )
+    try:
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/jobs",
+            "query_string": b"a=1",
+            "client": ("10.0.0.1", 1234),
+            "http_version": "1.1",
+        }
+        await _AccessLogMiddleware(app)(scope, None, send)  # type: ignore[arg-type]
+    finally:
+        logger.remove(sink_id)
+
+    assert [m["type"] for m in sent] == ["http.response.start", "http.response.body"]
+    assert len(lines) == 1
+    assert lines[0].startswith('10.0.0.1:1234 - "GET /jobs?a=1 HTTP/1.1" 418 (')
+
+
+# ---------------------------------------------------------------------------
+# CLI helpers
+# ---------------------------------------------------------------------------
+
+
+def test_format_table_layout() -> None:
+    """_format_table renders a boxed two-column table with aligned borders."""
+    from sipstuff_k8s_operator.__main__ import _format_table
+
+    table = _format_table("title", [("a", "1"), ("long-key", "value")])
+    lines = table.split("\n")
+
+    assert lines[0].startswith("┍") and lines[0].endswith("┑")
+    assert lines[1] == "│" + "title".center(len(lines[0]) - 2) + "│"
+    assert lines[3] == "│ a        │ 1     │"
+    assert lines[5] == "│ long-key │ value │"
+    assert lines[-1].startswith("┕") and lines[-1].endswith("┙")
+    assert len({len(line) for line in lines}) == 1
+
+
+def test_strip_none() -> None:
+    """_strip_none drops None-valued keys at every depth, in place, and leaves list items alone."""
+    from sipstuff_k8s_operator.__main__ import _strip_none
+
+    data = {"a": None, "b": {"c": None, "d": 1}, "e": [{"f": None, "g": [None, {"h": None}]}, None]}
+    assert _strip_none(data) is data
+    assert data == {"b": {"d": 1}, "e": [{"g": [None, {}]}, None]}
+    assert _strip_none("x") == "x"
+
+
+def test_dumpjob_json_alias(capsys: pytest.CaptureFixture[str]) -> None:
+    """``dumpjob --json`` (as documented) prints the Job manifest as JSON."""
+    from sipstuff_k8s_operator.__main__ import dumpjob
+
+    with patch.dict(os.environ, {}, clear=True):
+        dumpjob(["--json"])
+    job = orjson.loads(capsys.readouterr().out)
+    assert job["kind"] == "Job"
+
+
+def test_dumpjob_yaml_has_no_aliases(capsys: pytest.CaptureFixture[str]) -> None:
+    """The YAML manifest spells out the volumeMounts shared by both containers instead of aliasing them."""
+    from sipstuff_k8s_operator.__main__ import dumpjob
+
+    with patch.dict(os.environ, {}, clear=True):
+        dumpjob(["--recording-dir", "/rec", "--run-as-user", "1200", "--fs-group", "1201"])
+    out = capsys.readouterr().out
+    assert out.count("mountPath: /data/recordings") == 2
+    assert "&id" not in out
+    assert "*id" not in out
+
+
+def test_split_callrequest_args() -> None:
+    """CallRequest flags are swept out of argv; everything else is left for argparse."""
+    import argparse
+
+    from sipstuff_k8s_operator.__main__ import _split_callrequest_args
+
+    parser = argparse.ArgumentParser()
+    values, rest = _split_callrequest_args(
+        ["myimage:1", "--text", "hi", "--sip-port=5061", "--verbose", "--recording-dir", "/rec"], parser
+    )
+    assert values == {"text": "hi", "sip_port": "5061", "verbose": True}
+    assert rest == ["myimage:1", "--recording-dir", "/rec"]
+
+    with pytest.raises(SystemExit):
+        _split_callrequest_args(["--text"], parser)
+    with pytest.raises(SystemExit):
+        _split_callrequest_args(["--verbose=yes"], parser)
+
+
+def test_split_callrequest_args_rejects_flag_as_value() -> None:
+    """A ``--``-prefixed next token is not swallowed as a value; the inline form still accepts it."""
+    import argparse
+
+    from sipstuff_k8s_operator.__main__ import _split_callrequest_args
+
+    parser = argparse.ArgumentParser()
+    with patch.object(parser, "error", side_effect=SystemExit(2)) as error:
+        with pytest.raises(SystemExit):
+            _split_callrequest_args(["--text", "--verbose"], parser)
+    error.assert_called_once_with("argument --text: expected one argument")
 
-    assert job.spec.template.spec.node_selector is None
+    values, rest = _split_callrequest_args(["--text=--verbose"], parser)
+    assert values == {"text": "--verbose"}
+    assert rest == []